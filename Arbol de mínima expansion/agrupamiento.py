@@ -0,0 +1,55 @@
+import numpy as np
+
+from kruskal import kruskal_arrays
+from union_find import UnionFind
+
+
+class Agrupamiento:
+    """Agrupamiento de enlace simple (single linkage) a partir del árbol de mínima expansión.
+
+    Cortar las k - 1 aristas más caras del árbol deja exactamente las k zonas
+    del enlace simple, así que Kruskal corre una sola vez y todo lo demás sale
+    de sus aristas ya ordenadas. Los nodos son 0..n-1 (los de los scripts, que
+    empiezan en 1, se pasan restando 1). También se le puede pasar directamente
+    el árbol de arbol_euclidiano con sus distancias.
+
+    `enlaces` es el dendrograma completo en el formato de
+    scipy.cluster.hierarchy.linkage: la fila i une los grupos enlaces[i, 0] y
+    enlaces[i, 1] a distancia enlaces[i, 2] en un grupo nuevo n + i de
+    enlaces[i, 3] nodos. Si el grafo no es conexo tiene menos de n - 1 filas.
+    """
+
+    def __init__(self, u, v, w, n):
+        u = np.asarray(u)
+        v = np.asarray(v)
+        w = np.asarray(w)
+        _, usadas = kruskal_arrays(u, v, w, n)
+        self.n = n
+        self.componentes = n - len(usadas)
+        self._u = u[usadas]
+        self._v = v[usadas]
+        self.enlaces = self._dendrograma(w[usadas])
+
+    def _dendrograma(self, pesos):
+        # Una pasada por las aristas del árbol en orden; cada raíz recuerda el número de su grupo
+        uf = UnionFind(self.n)
+        grupo = list(range(self.n))
+        enlaces = np.empty((len(pesos), 4))
+        for i, (a, b, peso) in enumerate(zip(self._u.tolist(), self._v.tolist(), pesos.tolist())):
+            ra = uf.find(a)
+            rb = uf.find(b)
+            ga, gb = sorted((grupo[ra], grupo[rb]))
+            enlaces[i] = ga, gb, peso, uf.size[ra] + uf.size[rb]
+            uf.union(ra, rb)
+            grupo[uf.find(ra)] = self.n + i
+        return enlaces
+
+    def etiquetas(self, k):
+        # Zona 0..k-1 de cada nodo: se aplican las uniones del árbol salvo las k - componentes más caras
+        if not self.componentes <= k <= self.n:
+            raise ValueError(f"k debe estar entre {self.componentes} y {self.n}")
+        uf = UnionFind(self.n)
+        uniones = self.n - k
+        uf.union_many(self._u[:uniones], self._v[:uniones])
+        _, zonas = np.unique(uf.find_many(np.arange(self.n)), return_inverse=True)
+        return zonas
@@ -0,0 +1,125 @@
+from bisect import bisect_left, insort
+from collections import deque
+
+from kruskal import kruskal_mst
+
+
+class ArbolDinamico:
+    """Árbol de mínima expansión que se mantiene al agregar o quitar conexiones.
+
+    Arranca con el resultado de kruskal_mst y después cada cambio se resuelve
+    localmente: al insertar (u, v, w) se busca el camino u-v en el árbol y, si
+    su arista más cara pesa más que w, se reemplaza; al quitar una arista del
+    árbol se busca la conexión más barata que vuelva a unir los dos lados. Cada
+    operación cuesta O(n) (más el recorrido de las conexiones que quedaron
+    afuera al quitar), en lugar del O(m log m) de recalcular todo. Nodos 1..n
+    como en los scripts (insertar acepta nodos nuevos); entre cada par de nodos
+    hay a lo sumo una conexión.
+    """
+
+    def __init__(self, edges, num_nodes):
+        mejores = {}
+        for u, v, weight in edges:
+            if u != v:
+                clave = _par(u, v)
+                mejores[clave] = min(weight, mejores.get(clave, weight))
+        candidatas = [(u, v, weight) for (u, v), weight in mejores.items()]
+        self.peso_total, aristas_usadas = kruskal_mst(candidatas, num_nodes)
+
+        self._pesos = mejores  # todas las conexiones: par -> peso
+        self._arbol = {nodo: {} for nodo in range(1, num_nodes + 1)}
+        for u, v, weight in aristas_usadas:
+            self._arbol[u][v] = weight
+            self._arbol[v][u] = weight
+        # Las que no están en el árbol, ordenadas por peso para reemplazar rápido al quitar
+        en_arbol = {_par(u, v) for u, v, _ in aristas_usadas}
+        self._fuera = sorted((weight, u, v) for (u, v), weight in mejores.items() if (u, v) not in en_arbol)
+
+    def aristas(self):
+        return [(u, v, weight) for u, vecinos in self._arbol.items() for v, weight in vecinos.items() if u < v]
+
+    def insertar(self, u, v, weight):
+        """Agrega la conexión (u, v, weight). Devuelve la arista que salió del árbol o None.
+
+        Si la nueva conexión no entra al árbol, o entra uniendo dos
+        componentes, no sale ninguna.
+        """
+        clave = _par(u, v)
+        if u == v:
+            raise ValueError("Una conexión debe unir dos nodos distintos")
+        if clave in self._pesos:
+            raise ValueError(f"Ya existe la conexión {u} - {v}")
+        self._pesos[clave] = weight
+        self._arbol.setdefault(u, {})
+        self._arbol.setdefault(v, {})
+
+        camino = self._camino(u, v)
+        if camino is None:
+            self._unir(u, v, weight)
+            return None
+        a, b, maximo = max(camino, key=lambda arista: arista[2])
+        if maximo <= weight:
+            insort(self._fuera, (weight, *clave))
+            return None
+        self._separar(a, b)
+        insort(self._fuera, (maximo, *_par(a, b)))
+        self._unir(u, v, weight)
+        return (a, b, maximo)
+
+    def eliminar(self, u, v):
+        """Quita la conexión (u, v). Devuelve la arista que la reemplazó en el árbol o None."""
+        clave = _par(u, v)
+        weight = self._pesos.pop(clave)
+        if v not in self._arbol[u]:
+            del self._fuera[bisect_left(self._fuera, (weight, *clave))]
+            return None
+
+        self._separar(u, v)
+        lado = self._componente(u)
+        for i, (w, a, b) in enumerate(self._fuera):
+            if (a in lado) != (b in lado):
+                del self._fuera[i]
+                self._unir(a, b, w)
+                return (a, b, w)
+        return None  # no hay con qué volver a unir: queda un bosque
+
+    def _camino(self, u, v):
+        # Aristas (a, b, peso) del camino u-v en el árbol, o None si están en componentes distintas
+        padre = {u: None}
+        cola = deque([u])
+        while cola and v not in padre:
+            x = cola.popleft()
+            for y in self._arbol[x]:
+                if y not in padre:
+                    padre[y] = x
+                    cola.append(y)
+        if v not in padre:
+            return None
+        camino = []
+        while padre[v] is not None:
+            camino.append((padre[v], v, self._arbol[v][padre[v]]))
+            v = padre[v]
+        return camino
+
+    def _componente(self, u):
+        vistos = {u}
+        pila = [u]
+        while pila:
+            for y in self._arbol[pila.pop()]:
+                if y not in vistos:
+                    vistos.add(y)
+                    pila.append(y)
+        return vistos
+
+    def _unir(self, u, v, weight):
+        self._arbol[u][v] = weight
+        self._arbol[v][u] = weight
+        self.peso_total += weight
+
+    def _separar(self, u, v):
+        self.peso_total -= self._arbol[u].pop(v)
+        del self._arbol[v][u]
+
+
+def _par(u, v):
+    return (u, v) if u < v else (v, u)
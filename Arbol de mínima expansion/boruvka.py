@@ -0,0 +1,138 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+
+def boruvka(u, v, w, num_nodes, procesos=1, tramo=1 << 20):
+    """Árbol (o bosque) de mínima expansión de Borůvka sobre arreglos de aristas.
+
+    En cada ronda cada componente elige su arista más barata hacia otra
+    componente y todas esas aristas se agregan juntas, así que hay a lo sumo
+    log2(n) rondas. Los empates de peso se rompen por el orden estable de
+    los pesos, igual que kruskal_arrays, para que nunca se cierre un ciclo.
+
+    Todo es vectorizado: la arista más barata por componente sale de un
+    np.minimum.at y la contracción de componentes de saltos de punteros, sin
+    ciclos en Python por arista ni por nodo. Con ``procesos > 1`` las aristas se
+    reparten en tramos de `tramo` entre procesos que leen u, v y las componentes
+    desde memoria compartida. Devuelve (peso_total, usadas) como kruskal_arrays.
+    """
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    w = np.asarray(w)
+    n = num_nodes + 1
+    por_rango = np.argsort(w, kind='stable')
+    rango = np.empty(len(w), dtype=np.int64)
+    rango[por_rango] = np.arange(len(w))
+    componente = np.arange(n, dtype=np.int64)
+
+    if procesos <= 1 or len(w) <= tramo:
+        elegidos = _rondas_en_serie(u, v, rango, por_rango, componente)
+    else:
+        elegidos = _rondas_en_paralelo(u, v, rango, por_rango, componente, procesos, tramo)
+    usadas = por_rango[np.sort(elegidos)] if elegidos else np.zeros(0, dtype=np.intp)
+    return w[usadas].sum().item(), usadas
+
+
+def _rondas_en_serie(u, v, rango, por_rango, componente):
+    elegidos = []
+    vivas = np.flatnonzero(u != v)
+    while len(vivas):
+        rangos = _contraer(*_mas_baratas(u[vivas], v[vivas], rango[vivas], componente),
+                           u, v, por_rango, componente)
+        if not len(rangos):
+            break
+        elegidos.extend(rangos.tolist())
+        vivas = vivas[componente[u[vivas]] != componente[v[vivas]]]
+    return elegidos
+
+
+def _rondas_en_paralelo(u, v, rango, por_rango, componente, procesos, tramo):
+    bloques = []
+    try:
+        descripcion = []
+        compartidos = {}
+        for nombre, arreglo in (('u', u), ('v', v), ('rango', rango), ('componente', componente)):
+            bloque = SharedMemory(create=True, size=max(arreglo.nbytes, 1))
+            bloques.append(bloque)
+            compartidos[nombre] = np.ndarray(arreglo.shape, arreglo.dtype, buffer=bloque.buf)
+            compartidos[nombre][:] = arreglo
+            descripcion.append((nombre, bloque.name, arreglo.shape, arreglo.dtype.str))
+        tramos = [(i, min(i + tramo, len(u))) for i in range(0, len(u), tramo)]
+
+        elegidos = []
+        with ProcessPoolExecutor(procesos, initializer=_iniciar_trabajador, initargs=(descripcion,)) as pool:
+            while True:
+                # Cada tramo da sus mínimos por componente; aquí se combinan de la misma forma
+                partes = list(pool.map(_mas_baratas_en_tramo, tramos))
+                componentes = np.concatenate([c for c, _ in partes])
+                minimos = np.concatenate([r for _, r in partes])
+                rangos = _contraer(*_minimo_por_grupo(componentes, minimos, len(componente)),
+                                   u, v, por_rango, componente)
+                if not len(rangos):
+                    break
+                elegidos.extend(rangos.tolist())
+                compartidos['componente'][:] = componente
+        return elegidos
+    finally:
+        for bloque in bloques:
+            bloque.close()
+            bloque.unlink()
+
+
+def _mas_baratas(u, v, rango, componente):
+    # Para cada componente con aristas hacia afuera: (componente, rango de su arista más barata)
+    cu = componente[u]
+    cv = componente[v]
+    cruzan = cu != cv
+    extremos = np.concatenate([cu[cruzan], cv[cruzan]])
+    rangos = np.concatenate([rango[cruzan], rango[cruzan]])
+    return _minimo_por_grupo(extremos, rangos, len(componente))
+
+
+def _minimo_por_grupo(grupos, valores, n):
+    minimo = np.full(n, np.iinfo(np.int64).max)
+    np.minimum.at(minimo, grupos, valores)
+    presentes = np.flatnonzero(minimo != np.iinfo(np.int64).max)
+    return presentes, minimo[presentes]
+
+
+def _contraer(componentes, rangos, u, v, por_rango, componente):
+    # Cada componente apunta a la del otro extremo de su arista elegida. Con rangos únicos
+    # los únicos ciclos son pares que eligieron la misma arista: el menor queda de raíz.
+    # Devuelve los rangos de las aristas agregadas y deja `componente` actualizado
+    if not len(componentes):
+        return rangos
+    aristas = por_rango[rangos]
+    cu = componente[u[aristas]]
+    otro = np.where(cu == componentes, componente[v[aristas]], cu)
+    sucesor = np.arange(len(componente), dtype=np.int64)
+    sucesor[componentes] = otro
+    mutuos = (sucesor[otro] == componentes) & (componentes < otro)
+    sucesor[componentes[mutuos]] = componentes[mutuos]
+    while True:
+        arriba = sucesor[sucesor]
+        if (arriba == sucesor).all():
+            break
+        sucesor = arriba
+    componente[:] = sucesor[componente]
+    return np.unique(rangos)
+
+
+_trabajador = {}
+
+
+def _iniciar_trabajador(descripcion):
+    bloques = []
+    for nombre, bloque_nombre, forma, tipo in descripcion:
+        bloque = SharedMemory(name=bloque_nombre)
+        bloques.append(bloque)
+        _trabajador[nombre] = np.ndarray(forma, np.dtype(tipo), buffer=bloque.buf)
+    _trabajador['bloques'] = bloques  # mantener vivos los mapeos mientras viva el proceso
+
+
+def _mas_baratas_en_tramo(tramo):
+    i, j = tramo
+    t = _trabajador
+    return _mas_baratas(t['u'][i:j], t['v'][i:j], t['rango'][i:j], t['componente'])
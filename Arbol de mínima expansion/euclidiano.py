@@ -0,0 +1,69 @@
+from itertools import combinations
+
+import numpy as np
+from scipy.spatial import Delaunay, QhullError, cKDTree
+
+from kruskal import kruskal_arrays
+
+
+def arbol_euclidiano(puntos, metodo='delaunay', vecinos=8):
+    """Árbol de mínima expansión entre sitios con el costo igual a la distancia.
+
+    `puntos` es un arreglo (n, 2) (o (n, d)) de coordenadas. En vez de las
+    n(n-1)/2 distancias, Kruskal corre sobre un grafo candidato de O(n)
+    aristas: con 'delaunay' las de la triangulación de Delaunay, que siempre
+    contienen al árbol euclidiano, así que el resultado es exacto; con 'kdtree'
+    las de los `vecinos` más cercanos de cada sitio (cKDTree), que es más
+    barato en dimensiones altas pero aproximado: si ese grafo queda
+    desconectado se duplica `vecinos` hasta conectarlo. Si los puntos no
+    admiten triangulación (todos alineados, menos de d + 1) se usa 'kdtree'.
+
+    Devuelve (peso_total, aristas) con aristas un arreglo (n - 1, 2) de índices
+    de puntos, en orden de distancia.
+    """
+    puntos = np.asarray(puntos, dtype=np.float64)
+    n = len(puntos)
+    if n < 2:
+        return 0.0, np.zeros((0, 2), dtype=np.intp)
+
+    if metodo not in ('delaunay', 'kdtree'):
+        raise ValueError(f"Método desconocido: {metodo!r}. Opciones: delaunay, kdtree")
+    if metodo == 'delaunay':
+        try:
+            u, v = _aristas_delaunay(puntos)
+        except (QhullError, ValueError):
+            metodo = 'kdtree'
+
+    if metodo == 'delaunay':
+        largo = np.linalg.norm(puntos[u] - puntos[v], axis=1)
+        _, usadas = kruskal_arrays(u, v, largo, n)
+    else:
+        arbol = cKDTree(puntos)
+        while True:
+            u, v = _aristas_vecinos(arbol, puntos, min(vecinos, n - 1))
+            largo = np.linalg.norm(puntos[u] - puntos[v], axis=1)
+            _, usadas = kruskal_arrays(u, v, largo, n)
+            if len(usadas) == n - 1 or vecinos >= n - 1:
+                break
+            vecinos *= 2
+    return largo[usadas].sum().item(), np.stack([u[usadas], v[usadas]], axis=1)
+
+
+def _aristas_delaunay(puntos):
+    triangulacion = Delaunay(puntos)
+    lados = [triangulacion.simplices[:, [i, j]] for i, j in combinations(range(puntos.shape[1] + 1), 2)]
+    # Los puntos repetidos (o casi) quedan fuera de la triangulación: se unen a su vértice más cercano
+    lados.append(triangulacion.coplanar[:, [0, 2]])
+    return _pares_unicos(np.concatenate(lados))
+
+
+def _aristas_vecinos(arbol, puntos, vecinos):
+    _, cercanos = arbol.query(puntos, k=vecinos + 1)
+    desde = np.repeat(np.arange(len(puntos)), vecinos + 1)
+    return _pares_unicos(np.stack([desde, cercanos.ravel()], axis=1))
+
+
+def _pares_unicos(pares):
+    pares = np.sort(pares, axis=1)
+    pares = np.unique(pares[pares[:, 0] != pares[:, 1]], axis=0)
+    return pares[:, 0], pares[:, 1]
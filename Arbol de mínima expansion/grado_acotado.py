@@ -0,0 +1,129 @@
+import numpy as np
+
+from kruskal import kruskal_arrays
+
+
+def arbol_grado_acotado(u, v, w, num_nodes, grado_maximo, iteraciones=200):
+    """Árbol de expansión barato donde ningún nodo supera su grado máximo (puertos).
+
+    El problema exacto es NP-difícil, así que combina dos cosas:
+    - Relajación lagrangiana: cada nodo i recibe un multiplicador λ_i >= 0, la
+      arista (a, b) pasa a costar w + λ_a + λ_b y un kruskal_arrays sobre esos
+      costos da la cota inferior L(λ) = costo del árbol - Σ λ_i * grado_maximo_i.
+      Los λ se ajustan por subgradiente (grado en el árbol - grado máximo).
+    - Reparación: el árbol de cada iteración se corrige intercambiando aristas
+      de los nodos excedidos por la conexión más barata que vuelve a unir el
+      árbol sin exceder a nadie; el mejor árbol reparado es la cota superior.
+
+    `grado_maximo` es un entero o un arreglo con un valor por nodo (0..num_nodes).
+    Devuelve (peso_total, usadas, cota_inferior, brecha) con brecha =
+    (peso_total - cota_inferior) / peso_total. Si ninguna reparación logra
+    respetar los grados lanza ValueError.
+    """
+    u = np.asarray(u)
+    v = np.asarray(v)
+    w = np.asarray(w)
+    n = num_nodes + 1
+    limite = np.broadcast_to(np.asarray(grado_maximo), (n,)).astype(np.int64)
+    multiplicador = np.zeros(n)
+    cota_inferior = -np.inf
+    mejor_peso, mejor = None, None
+    paso = 2.0
+    sin_mejora = 0
+
+    for _ in range(iteraciones):
+        costo = w + multiplicador[u] + multiplicador[v]
+        _, usadas = kruskal_arrays(u, v, costo, num_nodes)
+        valor = costo[usadas].sum() - multiplicador @ limite
+        if valor > cota_inferior + 1e-12:
+            cota_inferior, sin_mejora = valor, 0
+        else:
+            sin_mejora += 1
+            if sin_mejora >= 10:
+                paso, sin_mejora = paso / 2, 0
+
+        exceso = _grados(u[usadas], v[usadas], n) - limite
+        reparado = usadas if (exceso <= 0).all() else _reparar(u, v, w, usadas, limite, n)
+        if reparado is not None:
+            peso = w[reparado].sum().item()
+            if mejor_peso is None or peso < mejor_peso:
+                mejor_peso, mejor = peso, reparado
+        # Árbol factible con holgura complementaria: es óptimo y la cota lo alcanza
+        if reparado is usadas and multiplicador @ exceso == 0:
+            cota_inferior = max(cota_inferior, w[usadas].sum())
+            break
+        if mejor_peso is not None and mejor_peso - cota_inferior <= 1e-9 * max(1.0, abs(mejor_peso)):
+            break
+
+        norma = exceso @ exceso
+        if norma == 0 or paso < 1e-6:
+            break
+        objetivo = mejor_peso if mejor_peso is not None else 1.05 * abs(valor) + 1
+        multiplicador = np.maximum(0, multiplicador + paso * (objetivo - valor) / norma * exceso)
+
+    if mejor is None:
+        raise ValueError("No se encontró un árbol que respete los grados máximos")
+    cota_inferior = min(float(cota_inferior), mejor_peso)
+    brecha = (mejor_peso - cota_inferior) / mejor_peso if mejor_peso else 0.0
+    return mejor_peso, mejor, cota_inferior, brecha
+
+
+def _grados(desde, hasta, n):
+    return np.bincount(desde, minlength=n) + np.bincount(hasta, minlength=n)
+
+
+def _reparar(u, v, w, usadas, limite, n):
+    # Mientras haya un nodo x excedido, se saca una de sus aristas (x, c) y se reconecta el árbol
+    # con la arista más barata entre la rama de c y el resto que no toque nodos llenos; se elige
+    # el cambio que menos aumenta el peso. None si algún nodo no se puede descargar
+    usadas = usadas.tolist()
+    en_arbol = np.zeros(len(w), dtype=bool)
+    en_arbol[usadas] = True
+    grado = _grados(u[usadas], v[usadas], n)
+    while True:
+        exceso = grado - limite
+        x = int(np.argmax(exceso))
+        if exceso[x] <= 0:
+            return np.asarray(usadas, dtype=np.intp)
+
+        # Un BFS desde x marca en qué rama (vecino de x) cae cada nodo
+        vecinos = [[] for _ in range(n)]
+        for a, b, e in zip(u[usadas].tolist(), v[usadas].tolist(), usadas):
+            vecinos[a].append((b, e))
+            vecinos[b].append((a, e))
+        rama = [-1] * n
+        pila = []
+        for c, _ in vecinos[x]:
+            rama[c] = c
+            pila.append(c)
+        while pila:
+            z = pila.pop()
+            for y, _ in vecinos[z]:
+                if y != x and rama[y] < 0:
+                    rama[y] = rama[z]
+                    pila.append(y)
+        rama = np.asarray(rama)
+        rama_u = rama[u]
+        rama_v = rama[v]
+
+        mejor_cambio = None
+        for c, e in vecinos[x]:
+            libre = grado.copy()
+            libre[x] -= 1
+            libre[c] -= 1
+            libre = libre < limite
+            cruza = (rama_u == c) != (rama_v == c)
+            posibles = np.flatnonzero(cruza & ~en_arbol & libre[u] & libre[v] & (u != x) & (v != x))
+            if len(posibles):
+                nueva = int(posibles[np.argmin(w[posibles])])
+                if mejor_cambio is None or w[nueva] - w[e] < mejor_cambio[0]:
+                    mejor_cambio = (w[nueva] - w[e], e, nueva)
+        if mejor_cambio is None:
+            return None
+        _, e, nueva = mejor_cambio
+        usadas[usadas.index(e)] = nueva
+        en_arbol[e], en_arbol[nueva] = False, True
+        grado[u[e]] -= 1
+        grado[v[e]] -= 1
+        grado[u[nueva]] += 1
+        grado[v[nueva]] += 1
@@ -0,0 +1,39 @@
+import numpy as np
+
+from union_find import UnionFind
+
+
+def kruskal_arrays(u, v, w, num_nodes, bloque=1 << 16):
+    """Kruskal sobre arreglos NumPy de aristas (u[i], v[i], w[i]).
+
+    Ordena solo un arreglo de índices (argsort estable de los pesos) y pasa
+    las aristas por bloques de `bloque` a UnionFind.union_many; termina apenas
+    acepta num_nodes - 1 aristas. No copia ni reordena los arreglos de entrada.
+    Devuelve (peso_total, usadas) con los índices de las aristas elegidas, en
+    orden de peso.
+    """
+    u = np.asarray(u)
+    v = np.asarray(v)
+    w = np.asarray(w)
+    orden = np.argsort(w, kind='stable')
+    uf = UnionFind(num_nodes)
+    faltan = num_nodes - 1
+    usadas = []
+    for comienzo in range(0, len(orden), bloque):
+        if faltan <= 0:
+            break
+        indices = orden[comienzo:comienzo + bloque]
+        aceptadas = indices[uf.union_many(u[indices], v[indices])]
+        usadas.append(aceptadas)
+        faltan -= len(aceptadas)
+    usadas = np.concatenate(usadas) if usadas else np.zeros(0, dtype=np.intp)
+    return w[usadas].sum().item(), usadas
+
+
+def kruskal_mst(edges, num_nodes):
+    # Misma interfaz que antes: lista de (u, v, peso); la lista de entrada ya no se ordena
+    u, v, w = (np.array(columna) for columna in zip(*edges)) if edges else ([], [], [])
+    _, usadas = kruskal_arrays(u, v, w, num_nodes)
+    mst_edges = [edges[i] for i in usadas.tolist()]
+    mst_weight = sum(weight for _, _, weight in mst_edges)
+    return mst_weight, mst_edges
@@ -0,0 +1,96 @@
+import os
+import tempfile
+
+import numpy as np
+
+from union_find import UnionFind
+
+
+def guardar_aristas(ruta, u, v, w, bloque=1 << 22):
+    # Archivo .npy estructurado con campos u, v, w; se escribe por bloques con open_memmap,
+    # así que u, v y w también pueden ser arreglos mapeados desde disco
+    tipo = np.dtype([('u', np.asarray(u[:0]).dtype), ('v', np.asarray(v[:0]).dtype),
+                     ('w', np.asarray(w[:0]).dtype)])
+    salida = np.lib.format.open_memmap(ruta, mode='w+', dtype=tipo, shape=(len(u),))
+    for i in range(0, len(u), bloque):
+        salida['u'][i:i + bloque] = u[i:i + bloque]
+        salida['v'][i:i + bloque] = v[i:i + bloque]
+        salida['w'][i:i + bloque] = w[i:i + bloque]
+    salida.flush()
+    del salida
+
+
+def kruskal_externo(ruta, num_nodes, tamano_corrida=1 << 22, bloque=1 << 16, directorio=None):
+    """Kruskal para listas de aristas que no entran en memoria.
+
+    `ruta` es un .npy estructurado con campos u, v, w (ver guardar_aristas)
+    que se lee mapeado. Se ordena por mezcla externa: cada tramo de
+    `tamano_corrida` aristas se ordena en memoria y se guarda como una
+    corrida .npy en un directorio temporal; después las corridas se mezclan
+    leyendo `bloque` aristas de cada una y lo mezclado pasa directo por
+    UnionFind.union_many. En memoria quedan solo el UnionFind, las aristas
+    elegidas y un bloque por corrida. Mismo resultado que kruskal_arrays:
+    (peso_total, usadas) con los índices de las aristas en el archivo.
+    """
+    aristas = np.load(ruta, mmap_mode='r')
+    with tempfile.TemporaryDirectory(dir=directorio) as carpeta:
+        corridas = _armar_corridas(aristas, tamano_corrida, carpeta)
+        resultado = _mezclar(corridas, num_nodes, bloque)
+        del corridas  # cerrar los mapeos antes de borrar el directorio
+    return resultado
+
+
+def _armar_corridas(aristas, tamano_corrida, carpeta):
+    tipo = np.dtype([('u', aristas.dtype['u']), ('v', aristas.dtype['v']),
+                     ('w', aristas.dtype['w']), ('indice', np.int64)])
+    corridas = []
+    for numero, comienzo in enumerate(range(0, len(aristas), tamano_corrida)):
+        tramo = np.array(aristas[comienzo:comienzo + tamano_corrida])
+        orden = np.argsort(tramo['w'], kind='stable')
+        corrida = np.empty(len(tramo), dtype=tipo)
+        for campo in ('u', 'v', 'w'):
+            corrida[campo] = tramo[campo][orden]
+        corrida['indice'] = orden + comienzo
+        ruta = os.path.join(carpeta, f'corrida_{numero}.npy')
+        np.save(ruta, corrida)
+        corridas.append(np.load(ruta, mmap_mode='r'))
+    return corridas
+
+
+def _mezclar(corridas, num_nodes, bloque):
+    # Cada corrida está ordenada por (w, indice). En cada paso se toma como tope la menor
+    # última clave cargada entre las corridas que todavía tienen datos en disco: todo lo
+    # cargado hasta ese tope ya se puede procesar en orden
+    uf = UnionFind(num_nodes)
+    faltan = num_nodes - 1
+    leidos = [min(bloque, len(c)) for c in corridas]
+    cargados = [np.array(c[:n]) for c, n in zip(corridas, leidos)]
+    usadas = []
+    pesos = []
+    while faltan > 0 and any(len(c) for c in cargados):
+        topes = [(c['w'][-1], c['indice'][-1]) for c, corrida, n in zip(cargados, corridas, leidos)
+                 if len(c) and n < len(corrida)]
+        tope = min(topes) if topes else None
+
+        listos = []
+        for i, c in enumerate(cargados):
+            if tope is None:
+                cuantos = len(c)
+            else:
+                hasta_tope = (c['w'] < tope[0]) | ((c['w'] == tope[0]) & (c['indice'] <= tope[1]))
+                cuantos = int(np.count_nonzero(hasta_tope))
+            listos.append(c[:cuantos])
+            cargados[i] = c[cuantos:]
+            if not len(cargados[i]) and leidos[i] < len(corridas[i]):
+                cargados[i] = np.array(corridas[i][leidos[i]:leidos[i] + bloque])
+                leidos[i] += len(cargados[i])
+
+        listos = np.concatenate(listos)
+        listos = listos[np.lexsort((listos['indice'], listos['w']))]
+        aceptadas = listos[uf.union_many(listos['u'], listos['v'])]
+        usadas.append(aceptadas['indice'])
+        pesos.append(aceptadas['w'])
+        faltan -= len(aceptadas)
+    if not usadas:
+        return 0, np.zeros(0, dtype=np.int64)
+    return np.concatenate(pesos).sum().item(), np.concatenate(usadas)
@@ -0,0 +1,99 @@
+import heapq
+
+import numpy as np
+
+
+def prim_denso(costos):
+    """Prim en O(n^2) sobre una matriz de costos simétrica n x n.
+
+    np.inf marca los pares sin conexión. En cada paso se toma el nodo fuera
+    del árbol con clave mínima y se actualizan todas las claves con una sola
+    operación sobre su fila. Si el grafo no es conexo devuelve un bosque.
+    Devuelve (peso_total, padre) con padre[v] = -1 para la raíz de cada árbol.
+    """
+    costos = np.asarray(costos, dtype=np.float64)
+    n = len(costos)
+    padre = np.full(n, -1, dtype=np.intp)
+    clave = np.full(n, np.inf)
+    en_arbol = np.zeros(n, dtype=bool)
+    peso_total = 0.0
+    for _ in range(n):
+        v = int(np.argmin(clave))
+        if clave[v] == np.inf:
+            v = int(np.flatnonzero(~en_arbol)[0])  # componente nueva: v queda como raíz
+        else:
+            peso_total += clave[v]
+        # Los nodos del árbol quedan con clave infinita para que argmin no los vuelva a elegir
+        en_arbol[v] = True
+        clave[v] = np.inf
+        fila = costos[v]
+        mejora = (fila < clave) & ~en_arbol
+        clave[mejora] = fila[mejora]
+        padre[mejora] = v
+    return peso_total, padre
+
+
+def prim_heap(u, v, w, num_nodes):
+    # Prim con heapq sobre la lista de adyacencia (en CSR); las entradas viejas del heap se
+    # descartan al sacarlas. Nodos 0..num_nodes; devuelve (peso_total, usadas) como kruskal_arrays
+    u = np.asarray(u)
+    v = np.asarray(v)
+    w = np.asarray(w)
+    n = num_nodes + 1
+    m = len(w)
+    extremos = np.concatenate([u, v])
+    orden = np.argsort(extremos, kind='stable')
+    inicio = np.concatenate([[0], np.cumsum(np.bincount(extremos, minlength=n))]).tolist()
+    vecino = np.concatenate([v, u])[orden].tolist()
+    arista = (orden % m).tolist() if m else []
+    peso = w.tolist()
+
+    en_arbol = bytearray(n)
+    usadas = []
+    for raiz in range(n):
+        if en_arbol[raiz]:
+            continue
+        heap = [(0, raiz, -1)]
+        while heap:
+            _, x, a = heapq.heappop(heap)
+            if en_arbol[x]:
+                continue
+            en_arbol[x] = 1
+            if a >= 0:
+                usadas.append(a)
+            for i in range(inicio[x], inicio[x + 1]):
+                y = vecino[i]
+                if not en_arbol[y]:
+                    heapq.heappush(heap, (peso[arista[i]], y, arista[i]))
+    usadas = np.asarray(usadas, dtype=np.intp)
+    return w[usadas].sum().item(), usadas
+
+
+def prim(u, v, w, num_nodes, densidad_minima=0.25):
+    """Prim sobre arreglos de aristas, eligiendo la variante según la densidad.
+
+    Si hay al menos `densidad_minima` de todos los pares posibles arma la
+    matriz de costos y usa prim_denso; si no, prim_heap. Mismos nodos y mismo
+    resultado que kruskal_arrays: (peso_total, usadas).
+    """
+    u = np.asarray(u)
+    v = np.asarray(v)
+    w = np.asarray(w)
+    n = num_nodes + 1
+    if len(w) == 0 or len(w) < densidad_minima * n * (n - 1) / 2:
+        return prim_heap(u, v, w, num_nodes)
+
+    # Por cada par se queda la arista más barata (la primera en caso de empate)
+    clave = np.minimum(u, v) * n + np.maximum(u, v)
+    orden = np.lexsort((w, clave))
+    primeras = orden[np.unique(clave[orden], return_index=True)[1]]
+    primeras = primeras[u[primeras] != v[primeras]]
+    mejor = np.full((n, n), -1, dtype=np.intp)
+    mejor[u[primeras], v[primeras]] = primeras
+    mejor[v[primeras], u[primeras]] = primeras
+    costos = np.where(mejor >= 0, w[mejor], np.inf)
+
+    _, padre = prim_denso(costos)
+    hijos = np.flatnonzero(padre >= 0)
+    usadas = mejor[hijos, padre[hijos]]
+    return w[usadas].sum().item(), usadas
@@ -1,32 +1,4 @@
-class UnionFind:
-    def __init__(self, n):
-        self.parent = {i: i for i in range(1, n + 1)}
-
-    def find(self, x):
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, x, y):
-        rx = self.find(x)
-        ry = self.find(y)
-        if rx != ry:
-            self.parent[rx] = ry
-            return True
-        return False
-
-def kruskal_mst(edges, num_nodes):
-    edges.sort(key=lambda x: x[2])  # Ordenar por peso
-    uf = UnionFind(num_nodes)
-    mst_weight = 0
-    mst_edges = []
-
-    for u, v, weight in edges:
-        if uf.union(u, v):
-            mst_weight += weight
-            mst_edges.append((u, v, weight))
-    
-    return mst_weight, mst_edges
+from kruskal import kruskal_mst
 
 # Lista de aristas (u, v, peso)
 edges = [
@@ -0,0 +1,65 @@
+from array import array
+
+import numpy as np
+
+
+class UnionFind:
+    """Conjuntos disjuntos sobre los nodos 0..n guardados en arreglos.
+
+    Los scripts numeran los nodos desde 1, por eso hay n + 1 posiciones. `parent`
+    y `size` son array('i'): indexarlos de a uno es rápido desde Python, y las
+    versiones en lote (find_many, union_many) trabajan sobre vistas NumPy de la
+    misma memoria, sin copiar.
+    """
+
+    def __init__(self, n):
+        self.parent = array('i', range(n + 1))
+        self.size = array('i', [1]) * (n + 1)
+        self._parent = np.frombuffer(self.parent, dtype=np.int32)
+
+    def find(self, x):
+        # Iterativo con división de caminos: cada nodo pasa a apuntar a su abuelo
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        rx = self.find(x)
+        ry = self.find(y)
+        if rx == ry:
+            return False
+        if self.size[rx] < self.size[ry]:
+            rx, ry = ry, rx
+        self.parent[ry] = rx  # el conjunto chico cuelga del grande
+        self.size[rx] += self.size[ry]
+        return True
+
+    def find_many(self, nodos):
+        # Saltos de punteros para todos a la vez; al final cada nodo consultado apunta a su raíz
+        nodos = np.asarray(nodos, dtype=np.intp)
+        raices = self._parent[nodos]
+        while True:
+            arriba = self._parent[raices]
+            if (arriba == raices).all():
+                break
+            raices = arriba
+        self._parent[nodos] = raices
+        return raices
+
+    def union_many(self, u, v):
+        """Une los pares (u[i], v[i]) en orden y devuelve qué uniones juntaron dos conjuntos.
+
+        Los pares que ya estaban en el mismo conjunto al empezar el bloque se
+        descartan con find_many; el resto se une de a uno, en el orden dado, como
+        lo haría Kruskal.
+        """
+        u = np.asarray(u, dtype=np.intp)
+        v = np.asarray(v, dtype=np.intp)
+        unidos = np.zeros(len(u), dtype=bool)
+        candidatos = np.flatnonzero(self.find_many(u) != self.find_many(v))
+        union = self.union
+        for i, x, y in zip(candidatos.tolist(), u[candidatos].tolist(), v[candidatos].tolist()):
+            unidos[i] = union(x, y)
+        return unidos
@@ -0,0 +1,85 @@
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+
+from flujo_maximo import METODOS
+from generadores import FAMILIAS
+from observadores import Contadores
+
+
+def medir(red, origen, sumidero, metodo):
+    inicio = time.perf_counter()
+    valor = METODOS[metodo](red, origen, sumidero)
+    return valor, time.perf_counter() - inicio
+
+
+def instrumentar(red, origen, sumidero, metodo):
+    # Segunda corrida, aparte de la medición de tiempo: contadores y pico de memoria
+    contadores = Contadores()
+    tracemalloc.start()
+    try:
+        METODOS[metodo](red, origen, sumidero, observador=contadores)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return contadores.resumen(), pico
+
+
+def _version_codigo():
+    try:
+        salida = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True)
+    except OSError:
+        return None
+    return salida.stdout.strip() or None
+
+
+def correr(familias, tamanos, metodos, semilla, repeticiones, salida):
+    comun = {
+        'fecha': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': _version_codigo(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+    }
+    print(f"{'Familia':20} {'Arcos':>9} {'Método':26} {'Flujo':>10} {'Tiempo (s)':>11} "
+          f"{'Aumentos':>9} {'Arcos revisados':>16} {'Memoria (MB)':>13}")
+    with open(salida, 'a') as archivo:
+        for familia in familias:
+            for tamano in tamanos:
+                red, origen, sumidero = FAMILIAS[familia](tamano, semilla)
+                arcos = int(red.original.sum())
+                for metodo in metodos:
+                    tiempos = []
+                    for _ in range(repeticiones):
+                        valor, segundos = medir(red, origen, sumidero, metodo)
+                        tiempos.append(segundos)
+                    conteo, pico = instrumentar(red, origen, sumidero, metodo)
+                    registro = dict(comun, familia=familia, semilla=semilla, nodos=red.num_nodos,
+                                    arcos=arcos, metodo=metodo, flujo=valor, segundos=min(tiempos),
+                                    aumentos=conteo['aumentos'], busquedas=conteo['busquedas'],
+                                    arcos_revisados=conteo['arcos_revisados'],
+                                    memoria_pico_bytes=pico)
+                    archivo.write(json.dumps(registro) + '\n')
+                    archivo.flush()
+                    print(f"{familia:20} {arcos:9d} {metodo:26} {valor:10} {min(tiempos):11.3f} "
+                          f"{conteo['aumentos']:9d} {conteo['arcos_revisados']:16d} {pico / 2**20:13.1f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compara los algoritmos de flujo máximo en instancias generadas.')
+    parser.add_argument('--familias', nargs='+', choices=list(FAMILIAS), default=list(FAMILIAS))
+    parser.add_argument('--arcos', nargs='+', type=lambda x: int(float(x)), default=[1_000, 10_000, 100_000],
+                        help='tamaños aproximados en arcos (ej.: 1e3 1e4 1e5 1e6)')
+    parser.add_argument('--metodos', nargs='+', choices=list(METODOS), default=list(METODOS))
+    parser.add_argument('--semilla', type=int, default=1)
+    parser.add_argument('--repeticiones', type=int, default=1, help='se guarda el menor tiempo')
+    parser.add_argument('--salida', default='resultados_flujo.jsonl',
+                        help='archivo JSON Lines al que se agrega un registro por corrida')
+    argumentos = parser.parse_args()
+    correr(argumentos.familias, argumentos.arcos, argumentos.metodos, argumentos.semilla,
+           argumentos.repeticiones, argumentos.salida)
@@ -0,0 +1,189 @@
+import gzip
+import os
+import struct
+import zipfile
+
+import numpy as np
+
+from grafo_residual import GrafoResidual, desde_arcos
+
+_CAMPOS = ('inicio', 'destino', 'capacidad', 'inverso', 'original')
+
+
+def cargar(ruta, cache=True, bloque=1_000_000):
+    """Carga una instancia de flujo máximo desde DIMACS (.max) o CSV (u,v,capacidad).
+
+    Ambos formatos pueden venir comprimidos con gzip (.gz). Con `cache`, la red
+    ya convertida se guarda junto al archivo como .npz sin comprimir, y las
+    cargas siguientes mapean esos arreglos en memoria en vez de volver a leer
+    el texto. Devuelve (red, origen, sumidero); en CSV origen y sumidero son None.
+    """
+    ruta_cache = ruta + '.npz'
+    if cache and os.path.exists(ruta_cache) and os.path.getmtime(ruta_cache) >= os.path.getmtime(ruta):
+        return cargar_npz(ruta_cache)
+
+    base = ruta[:-3] if ruta.endswith('.gz') else ruta
+    if base.endswith('.csv'):
+        red, origen, sumidero = leer_aristas_csv(ruta, bloque=bloque), None, None
+    else:
+        red, origen, sumidero = leer_dimacs(ruta, bloque=bloque)
+
+    if cache:
+        guardar_npz(red, ruta_cache, origen, sumidero)
+    return red, origen, sumidero
+
+
+def leer_dimacs(ruta, bloque=1_000_000):
+    # Formato DIMACS de flujo máximo: "p max N M", "n id s|t", "a u v capacidad"; nodos desde 1
+    num_nodos = 0
+    origen = sumidero = None
+    desde, hasta, capacidad = [], [], []
+    pendientes = []
+    with _abrir(ruta) as archivo:
+        for linea in archivo:
+            if linea.startswith('a'):
+                pendientes.append(linea[1:])
+                if len(pendientes) >= bloque:
+                    _agregar_bloque(pendientes, desde, hasta, capacidad)
+                    pendientes = []
+            elif linea.startswith('p'):
+                num_nodos = int(linea.split()[2])
+            elif linea.startswith('n'):
+                _, nodo, tipo = linea.split()
+                if tipo == 's':
+                    origen = int(nodo) - 1
+                else:
+                    sumidero = int(nodo) - 1
+    _agregar_bloque(pendientes, desde, hasta, capacidad)
+
+    red = desde_arcos(_unir(desde, np.int64) - 1, _unir(hasta, np.int64) - 1,
+                      _unir(capacidad, np.int64), nodos=range(num_nodos))
+    return red, origen, sumidero
+
+
+def leer_aristas_csv(ruta, delimitador=',', bloque=1_000_000):
+    # Una arista por línea: origen, destino, capacidad (con o sin encabezado)
+    desde, hasta, capacidad = [], [], []
+    pendientes = []
+    with _abrir(ruta) as archivo:
+        for numero, linea in enumerate(archivo):
+            campos = linea.strip().split(delimitador)
+            if len(campos) < 3:
+                continue
+            if numero == 0 and not _es_numero(campos[2]):
+                continue  # encabezado
+            pendientes.append(campos[:3])
+            if len(pendientes) >= bloque:
+                _agregar_bloque_csv(pendientes, desde, hasta, capacidad)
+                pendientes = []
+    _agregar_bloque_csv(pendientes, desde, hasta, capacidad)
+
+    # Los nombres se internan de una vez para todos los bloques
+    partes = desde + hasta
+    if any(parte.dtype.kind == 'U' for parte in partes):
+        partes = [parte.astype(str) for parte in partes]
+    etiquetas = _unir(partes, np.int64)
+    nombres, ids = np.unique(etiquetas, return_inverse=True)
+    m = len(etiquetas) // 2
+    if nombres.dtype.kind in 'iu' and len(nombres) and nombres[0] == 0 and nombres[-1] == len(nombres) - 1:
+        nodos = range(len(nombres))
+    else:
+        nodos = nombres.tolist()
+    return desde_arcos(ids[:m], ids[m:], _unir(capacidad, np.int64), nodos=nodos)
+
+
+def guardar_npz(red, ruta, origen=None, sumidero=None):
+    # Sin comprimir: así cada arreglo queda contiguo dentro del .npz y se puede mapear
+    extra = {}
+    if isinstance(red.nodos, range):
+        extra['num_nodos'] = np.int64(red.num_nodos)
+    else:
+        extra['nodos'] = np.asarray(red.nodos)
+    terminales = [red.indice[x] if x is not None else -1 for x in (origen, sumidero)]
+    with open(ruta, 'wb') as archivo:
+        np.savez(archivo, terminales=np.asarray(terminales, dtype=np.int64),
+                 **{campo: getattr(red, campo) for campo in _CAMPOS}, **extra)
+
+
+def cargar_npz(ruta):
+    arreglos = _mapear_npz(ruta)
+    if 'nodos' in arreglos:
+        nodos = np.asarray(arreglos['nodos']).tolist()
+    else:
+        nodos = range(int(arreglos['num_nodos']))
+    red = GrafoResidual(nodos, **{campo: arreglos[campo] for campo in _CAMPOS})
+    origen, sumidero = (red.nodos[i] if i >= 0 else None for i in arreglos['terminales'].tolist())
+    return red, origen, sumidero
+
+
+def _mapear_npz(ruta):
+    # np.load ignora mmap_mode en los .npz; como cada .npy va guardado sin comprimir,
+    # se ubica su posición dentro del zip y se mapea directamente con np.memmap
+    arreglos = {}
+    with zipfile.ZipFile(ruta) as contenedor, open(ruta, 'rb') as archivo:
+        for info in contenedor.infolist():
+            nombre = info.filename[:-4]
+            if info.compress_type != zipfile.ZIP_STORED:
+                arreglos[nombre] = np.load(contenedor.open(info))
+                continue
+            archivo.seek(info.header_offset)
+            cabecera = archivo.read(30)
+            largo_nombre, largo_extra = struct.unpack('<HH', cabecera[26:30])
+            archivo.seek(info.header_offset + 30 + largo_nombre + largo_extra)
+            if np.lib.format.read_magic(archivo) == (1, 0):
+                forma, fortran, tipo = np.lib.format.read_array_header_1_0(archivo)
+            else:
+                forma, fortran, tipo = np.lib.format.read_array_header_2_0(archivo)
+            if tipo.hasobject or len(forma) == 0 or 0 in forma:
+                arreglos[nombre] = np.load(contenedor.open(info), allow_pickle=False)
+                continue
+            arreglos[nombre] = np.memmap(ruta, dtype=tipo, mode='r', offset=archivo.tell(),
+                                         shape=forma, order='F' if fortran else 'C')
+    return arreglos
+
+
+def _abrir(ruta):
+    if ruta.endswith('.gz'):
+        return gzip.open(ruta, 'rt')
+    return open(ruta)
+
+
+def _agregar_bloque(lineas, desde, hasta, capacidad):
+    if not lineas:
+        return
+    campos = np.array(' '.join(lineas).split()).reshape(-1, 3)
+    desde.append(campos[:, 0].astype(np.int64))
+    hasta.append(campos[:, 1].astype(np.int64))
+    capacidad.append(_como_numeros(campos[:, 2]))
+
+
+def _agregar_bloque_csv(filas, desde, hasta, capacidad):
+    if not filas:
+        return
+    campos = np.array(filas)
+    for columna, destino in ((campos[:, 0], desde), (campos[:, 1], hasta)):
+        try:
+            destino.append(columna.astype(np.int64))
+        except ValueError:
+            destino.append(np.char.strip(columna))
+    capacidad.append(_como_numeros(campos[:, 2]))
+
+
+def _unir(partes, tipo):
+    return np.concatenate(partes) if partes else np.zeros(0, dtype=tipo)
+
+
+def _como_numeros(texto):
+    # Enteros si todo el bloque lo es; si no, flotantes (al unir bloques mixtos queda flotante)
+    try:
+        return texto.astype(np.int64)
+    except ValueError:
+        return texto.astype(np.float64)
+
+
+def _es_numero(texto):
+    try:
+        float(texto)
+        return True
+    except ValueError:
+        return False
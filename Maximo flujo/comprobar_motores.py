@@ -0,0 +1,37 @@
+from flujo_maximo import METODOS
+from generadores import bipartito
+
+# Instancias que alguna vez dieron un flujo distinto entre métodos: (descripción, red, origen, sumidero).
+# El método voraz original no usa arcos inversos y puede quedar por debajo del máximo, así que no se compara
+INSTANCIAS = [
+    # push_relabel conservaba los punteros de arco actual tras el reetiquetado global
+    ('bipartito(300, semilla=4)', *bipartito(300, 4), 2463),
+    ('bipartito(200, semilla=29)', *bipartito(200, 29), 1492),
+]
+
+
+def comprobar():
+    errores = []
+    for nombre, red, origen, sumidero, esperado in INSTANCIAS:
+        for metodo, calculo in METODOS.items():
+            if metodo == 'edmonds_karp_no_inversos':
+                continue
+            valor = calculo(red, origen, sumidero)
+            if valor != esperado:
+                errores.append(f"{nombre}: {metodo} dio {valor}, se esperaba {esperado}")
+    # Origen igual al sumidero: todos los métodos, incluido el voraz, deben devolver 0 sin colgarse
+    red, origen, _, _ = INSTANCIAS[0][1:]
+    for metodo, calculo in METODOS.items():
+        valor = calculo(red, origen, origen)
+        if valor != 0:
+            errores.append(f"origen = sumidero: {metodo} dio {valor}, se esperaba 0")
+    return errores
+
+
+if __name__ == '__main__':
+    errores = comprobar()
+    for error in errores:
+        print(error)
+    if errores:
+        raise SystemExit(1)
+    print("Todos los métodos coinciden")
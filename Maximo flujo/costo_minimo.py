@@ -0,0 +1,129 @@
+import heapq
+from collections import deque
+
+import numpy as np
+
+from grafo_residual import GrafoResidual, desde_arcos
+
+
+def red_con_costos(grafo):
+    # grafo[u][v] = capacidad  o  grafo[u][v] = (capacidad, costo por unidad); sin costo vale 0
+    indice = {}
+    desde, hasta, capacidad, costo = [], [], [], []
+    for u in grafo:
+        indice.setdefault(u, len(indice))
+        for v, dato in grafo[u].items():
+            indice.setdefault(v, len(indice))
+            c, w = dato if isinstance(dato, tuple) else (dato, 0)
+            desde.append(indice[u])
+            hasta.append(indice[v])
+            capacidad.append(c)
+            costo.append(w)
+    return desde_arcos(desde, hasta, capacidad, costo=costo, nodos=list(indice))
+
+
+def flujo_costo_minimo(grafo, origen, sumidero, limite=None, costo_maximo=None):
+    """Flujo máximo de costo mínimo por caminos más cortos sucesivos.
+
+    Usa potenciales de Johnson para que Dijkstra (con heap binario) trabaje con
+    costos reducidos no negativos. Con `limite` se detiene al enviar esa
+    cantidad y con `costo_maximo` cuando el camino más barato cuesta más que
+    eso por unidad. Devuelve (flujo, costo) y deja el flujo por arco en la red.
+    """
+    red = grafo if isinstance(grafo, GrafoResidual) else red_con_costos(grafo)
+    if red.costo is None:
+        raise ValueError("La red no tiene costos por arco")
+    s = red.indice[origen]
+    t = red.indice[sumidero]
+
+    inicio = red.inicio.tolist()
+    destino = red.destino.tolist()
+    inverso = red.inverso.tolist()
+    costo = red.costo.tolist()
+    residual = red.capacidad.tolist()
+    n = red.num_nodos
+    limite = float('inf') if limite is None else limite
+
+    # Potenciales iniciales: cero si no hay costos negativos, Bellman-Ford (SPFA) si los hay
+    potencial = [0] * n
+    if any(c < 0 for c, r in zip(costo, residual) if r > 0):
+        potencial = _bellman_ford(inicio, destino, costo, residual, s, n)
+
+    flujo_total = 0
+    costo_total = 0
+    while flujo_total < limite:
+        # Dijkstra con costos reducidos costo[a] + potencial[u] - potencial[v] >= 0
+        distancia = [float('inf')] * n
+        arco_padre = [-1] * n
+        cerrado = bytearray(n)
+        distancia[s] = 0
+        heap = [(0, s)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if cerrado[u]:
+                continue
+            cerrado[u] = 1
+            if u == t:
+                break
+            pu = potencial[u]
+            for a in range(inicio[u], inicio[u + 1]):
+                if residual[a] > 0:
+                    v = destino[a]
+                    nueva = d + costo[a] + pu - potencial[v]
+                    if nueva < distancia[v]:
+                        distancia[v] = nueva
+                        arco_padre[v] = a
+                        heapq.heappush(heap, (nueva, v))
+        if not cerrado[t]:
+            break
+        # Costo real por unidad del camino (sin los potenciales); nunca baja entre iteraciones
+        if costo_maximo is not None and distancia[t] + potencial[t] - potencial[s] > costo_maximo:
+            break
+
+        # Los nodos no cerrados avanzan lo mismo que el sumidero: los costos reducidos siguen >= 0
+        dt = distancia[t]
+        for v in range(n):
+            potencial[v] += min(distancia[v], dt)
+
+        f = limite - flujo_total
+        v = t
+        while v != s:
+            a = arco_padre[v]
+            f = min(f, residual[a])
+            v = destino[inverso[a]]
+        v = t
+        while v != s:
+            a = arco_padre[v]
+            residual[a] -= f
+            residual[inverso[a]] += f
+            costo_total += f * costo[a]
+            v = destino[inverso[a]]
+        flujo_total += f
+
+    red.flujo[:] = red.capacidad - np.asarray(residual, dtype=red.capacidad.dtype)
+    return flujo_total, costo_total
+
+
+def _bellman_ford(inicio, destino, costo, residual, s, n):
+    distancia = [float('inf')] * n
+    distancia[s] = 0
+    en_cola = bytearray(n)
+    entradas = [0] * n
+    cola = deque([s])
+    en_cola[s] = 1
+    while cola:
+        u = cola.popleft()
+        en_cola[u] = 0
+        entradas[u] += 1
+        if entradas[u] > n:
+            raise ValueError("La red tiene un ciclo de costo negativo alcanzable desde el origen")
+        for a in range(inicio[u], inicio[u + 1]):
+            if residual[a] > 0:
+                v = destino[a]
+                if distancia[u] + costo[a] < distancia[v]:
+                    distancia[v] = distancia[u] + costo[a]
+                    if not en_cola[v]:
+                        en_cola[v] = 1
+                        cola.append(v)
+    # Los nodos inalcanzables desde el origen nunca entran en un camino aumentante
+    return [d if d != float('inf') else 0 for d in distancia]
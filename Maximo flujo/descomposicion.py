@@ -0,0 +1,66 @@
+def descomponer_flujo(red, origen, sumidero):
+    """Descompone el flujo guardado en la red en caminos origen-sumidero y ciclos.
+
+    Es un generador: entrega tuplas ('camino' | 'ciclo', [nodos], flujo) a medida
+    que las encuentra. Cada entrega anula al menos un arco, así que hay a lo sumo
+    E de ellas y el total es O(VE). A diferencia de los caminos aumentantes que
+    ve un observador, estos no se cancelan entre sí: sumados dan el flujo final.
+    """
+    s = red.indice[origen]
+    t = red.indice[sumidero]
+    inicio = red.inicio.tolist()
+    destino = red.destino.tolist()
+    restante = red.flujo.clip(min=0).tolist()  # flujo neto positivo por arco
+    actual = inicio[:-1]
+    nombres = red.nodos
+
+    def siguiente_arco(u):
+        # Avanza el puntero de u hasta un arco que todavía lleve flujo
+        a = actual[u]
+        fin = inicio[u + 1]
+        while a < fin and restante[a] <= 0:
+            a += 1
+        actual[u] = a
+        return a if a < fin else -1
+
+    def recorrer(desde, hasta=None):
+        # Sigue arcos con flujo desde `desde`; si repite un nodo entrega el ciclo y sigue
+        arcos = []
+        posicion = {desde: 0}
+        u = desde
+        while True:
+            if u == hasta:
+                f = min(restante[a] for a in arcos)
+                for a in arcos:
+                    restante[a] -= f
+                yield 'camino', [nombres[desde]] + [nombres[destino[a]] for a in arcos], f
+                return
+            a = siguiente_arco(u)
+            if a < 0:
+                raise ValueError(f"El flujo no se conserva en el nodo {nombres[u]!r}")
+            arcos.append(a)
+            u = destino[a]
+            if u in posicion:
+                i = posicion[u]
+                ciclo = arcos[i:]
+                f = min(restante[b] for b in ciclo)
+                for b in ciclo:
+                    restante[b] -= f
+                yield 'ciclo', [nombres[u]] + [nombres[destino[b]] for b in ciclo], f
+                for b in ciclo[:-1]:
+                    del posicion[destino[b]]
+                del arcos[i:]
+                if not arcos:
+                    return  # se volvió al punto de partida; quien llama decide si sigue
+            else:
+                posicion[u] = len(arcos)
+
+    # Caminos: mientras salga flujo del origen (los ciclos que aparezcan en el camino se entregan aparte)
+    if s != t:
+        while siguiente_arco(s) >= 0:
+            yield from recorrer(s, t)
+
+    # Lo que queda es una circulación: solo ciclos
+    for u in range(red.num_nodos):
+        while siguiente_arco(u) >= 0:
+            yield from recorrer(u)
@@ -0,0 +1,35 @@
+from costo_minimo import flujo_costo_minimo, red_con_costos
+from descomposicion import descomponer_flujo
+
+
+def flujo_dinamico_maximo(grafo, origen, sumidero, horizonte):
+    """Máximo de unidades que llegan al sumidero en los periodos 0..horizonte.
+
+    grafo[u][v] = (capacidad por periodo, tiempo de recorrido en periodos). Lo
+    que sale de u en el periodo p llega a v en p + tiempo. En lugar de armar
+    la red expandida en el tiempo (horizonte + 1 copias de cada nodo y arco),
+    usa flujos repetidos en el tiempo (Ford-Fulkerson): un flujo estático de
+    costo mínimo con los tiempos como costos, solo por caminos que lleguen a
+    tiempo, se repite en cada periodo de salida posible. Un camino de duración
+    d usado a tasa x aporta (horizonte - d + 1) * x, así que el total es
+    (horizonte + 1) * |x| - suma(tiempo * x).
+
+    Devuelve (valor, plan) donde plan es una lista de (camino, tasa, ultima_salida):
+    por cada camino se envía `tasa` en cada periodo 0..ultima_salida.
+    """
+    red = red_con_costos(grafo)
+    flujo, tiempo_total = flujo_costo_minimo(red, origen, sumidero, costo_maximo=horizonte)
+    valor = (horizonte + 1) * flujo - tiempo_total
+
+    tiempos = {}
+    desde = red.arcos_desde()
+    for a in red.original.nonzero()[0]:
+        clave = (red.nodos[desde[a]], red.nodos[red.destino[a]])
+        tiempos[clave] = min(tiempos.get(clave, float('inf')), red.costo[a].item())
+
+    plan = []
+    for tipo, camino, tasa in descomponer_flujo(red, origen, sumidero):
+        if tipo == 'camino':
+            duracion = sum(tiempos[u, v] for u, v in zip(camino, camino[1:]))
+            plan.append((camino, tasa, horizonte - duracion))
+    return valor, plan
@@ -0,0 +1,119 @@
+from collections import deque
+
+import numpy as np
+
+from flujo_maximo import corte_minimo, dinic
+from grafo_residual import como_grafo_residual
+
+
+class FlujoIncremental:
+    """Flujo máximo que se mantiene al cambiar capacidades de calles.
+
+    Resuelve una vez con Dinic y después, ante cada cambio de capacidad, solo
+    aumenta o cancela la diferencia sobre el flujo y la red residual actuales
+    en lugar de recalcular desde flujo cero.
+    """
+
+    def __init__(self, grafo, origen, sumidero):
+        self.red = como_grafo_residual(grafo)
+        self.origen = origen
+        self.sumidero = sumidero
+        self.valor = dinic(self.red, origen, sumidero)
+
+        self._s = self.red.indice[origen]
+        self._t = self.red.indice[sumidero]
+        self._inicio = self.red.inicio.tolist()
+        self._destino = self.red.destino.tolist()
+        self._inverso = self.red.inverso.tolist()
+        self._capacidad = self.red.capacidad.tolist()
+        self._residual = self.red.residual().tolist()
+
+    def cambiar_capacidad(self, u, v, capacidad):
+        if capacidad < 0:
+            raise ValueError("La capacidad de una calle no puede ser negativa")
+        a = self._arco(u, v)
+        anterior = self._capacidad[a]
+        self._capacidad[a] = capacidad
+        self._residual[a] += capacidad - anterior
+
+        # Si el flujo actual de la calle ya no cabe, se devuelve el sobrante
+        sobrante = -self._residual[a]
+        resto = 0
+        if sobrante > 0:
+            self._residual[a] = 0
+            self._residual[self._inverso[a]] -= sobrante
+            iu, iv = self._destino[self._inverso[a]], self._destino[a]
+
+            # Primero se intenta desviar el sobrante por otro camino de u a v;
+            # lo que no se pueda desviar se cancela de vuelta hacia el origen y desde el sumidero
+            resto = sobrante - self._empujar(iu, iv, sobrante)
+            if resto > 0:
+                if iu != self._s:
+                    self._empujar(iu, self._s, resto)
+                if iv != self._t:
+                    self._empujar(self._t, iv, resto)
+                self.valor -= resto
+
+        # Con el flujo otra vez factible, solo falta aumentar lo que el cambio haya liberado. Si la
+        # capacidad bajó sin cancelar flujo el máximo no puede subir y se evita el BFS
+        if capacidad > anterior or resto > 0:
+            self.valor += self._empujar(self._s, self._t, float('inf'))
+        return self.valor
+
+    def cambiar_capacidades(self, cambios):
+        # cambios: {(u, v): nueva_capacidad}
+        for (u, v), capacidad in cambios.items():
+            self.cambiar_capacidad(u, v, capacidad)
+        return self.valor
+
+    def corte_minimo(self):
+        self._sincronizar()
+        return corte_minimo(self.red, self.origen, self.sumidero)
+
+    def flujos_por_arco(self):
+        self._sincronizar()
+        return self.red.flujos_por_arco()
+
+    def _arco(self, u, v):
+        iu = self.red.indice[u]
+        iv = self.red.indice[v]
+        for a in range(self._inicio[iu], self._inicio[iu + 1]):
+            if self._destino[a] == iv and self.red.original[a]:
+                return a
+        raise KeyError(f"La calle ({u!r}, {v!r}) no existe en la red")
+
+    def _empujar(self, x, y, limite):
+        # Caminos aumentantes (BFS) de x a y en la red residual hasta mover `limite`
+        if x == y:
+            return 0
+        inicio, destino, inverso, residual = self._inicio, self._destino, self._inverso, self._residual
+        movido = 0
+        while movido < limite:
+            arco_padre = {x: -1}
+            cola = deque([x])
+            while cola and y not in arco_padre:
+                u = cola.popleft()
+                for a in range(inicio[u], inicio[u + 1]):
+                    v = destino[a]
+                    if v not in arco_padre and residual[a] > 0:
+                        arco_padre[v] = a
+                        cola.append(v)
+            if y not in arco_padre:
+                break
+
+            camino = []
+            v = y
+            while v != x:
+                a = arco_padre[v]
+                camino.append(a)
+                v = destino[inverso[a]]
+            f = min(limite - movido, min(residual[a] for a in camino))
+            for a in camino:
+                residual[a] -= f
+                residual[inverso[a]] += f
+            movido += f
+        return movido
+
+    def _sincronizar(self):
+        self.red.capacidad[:] = self._capacidad
+        self.red.flujo[:] = self.red.capacidad - np.asarray(self._residual, dtype=self.red.capacidad.dtype)
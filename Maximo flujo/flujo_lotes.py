@@ -0,0 +1,69 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from flujo_maximo import METODOS
+from grafo_residual import GrafoResidual, como_grafo_residual
+
+_ESTRUCTURA = ('inicio', 'destino', 'capacidad', 'inverso', 'original')
+
+
+def flujos_en_lote(grafo, pares, metodo='dinic', procesos=None):
+    """Flujo máximo para cada par (origen, sumidero) de `pares`, en el mismo orden.
+
+    La red CSR se copia una sola vez a memoria compartida y cada proceso la
+    usa en modo lectura; cada trabajador solo guarda su propio arreglo de flujo.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido: {metodo!r}. Opciones: {', '.join(METODOS)}")
+    red = como_grafo_residual(grafo)
+    consultas = [(red.indice[s], red.indice[t]) for s, t in pares]
+    procesos = procesos or os.cpu_count() or 1
+
+    if procesos == 1 or len(consultas) <= 1:
+        calculo = METODOS[metodo]
+        return [calculo(red, red.nodos[s], red.nodos[t]) for s, t in consultas]
+
+    bloques = []
+    try:
+        descripcion = []
+        for nombre in _ESTRUCTURA:
+            arreglo = getattr(red, nombre)
+            bloque = SharedMemory(create=True, size=max(arreglo.nbytes, 1))
+            bloques.append(bloque)
+            np.ndarray(arreglo.shape, arreglo.dtype, buffer=bloque.buf)[:] = arreglo
+            descripcion.append((nombre, bloque.name, arreglo.shape, arreglo.dtype.str))
+
+        # Tareas agrupadas para no pagar un viaje entre procesos por cada consulta
+        tamano = max(1, len(consultas) // (4 * procesos))
+        with ProcessPoolExecutor(procesos, initializer=_iniciar_trabajador,
+                                 initargs=(descripcion, red.num_nodos, metodo)) as pool:
+            return list(pool.map(_resolver, consultas, chunksize=tamano))
+    finally:
+        for bloque in bloques:
+            bloque.close()
+            bloque.unlink()
+
+
+_trabajador = {}
+
+
+def _iniciar_trabajador(descripcion, num_nodos, metodo):
+    bloques = []
+    arreglos = {}
+    for nombre, bloque_nombre, forma, tipo in descripcion:
+        bloque = SharedMemory(name=bloque_nombre)
+        bloques.append(bloque)
+        arreglos[nombre] = np.ndarray(forma, np.dtype(tipo), buffer=bloque.buf)
+        arreglos[nombre].flags.writeable = False
+    # Los nodos se identifican por su índice: el padre ya tradujo los nombres
+    _trabajador['red'] = GrafoResidual(range(num_nodos), **arreglos)
+    _trabajador['metodo'] = METODOS[metodo]
+    _trabajador['bloques'] = bloques  # mantener vivos los mapeos mientras viva el proceso
+
+
+def _resolver(consulta):
+    s, t = consulta
+    return _trabajador['metodo'](_trabajador['red'], s, t)
@@ -0,0 +1,460 @@
+from collections import deque
+
+import numpy as np
+
+from boykov_kolmogorov import boykov_kolmogorov
+from grafo_residual import como_grafo_residual
+
+
+def edmonds_karp_no_inversos(grafo, origen, sumidero, observador=None):
+    red = como_grafo_residual(grafo)
+    s = red.indice[origen]
+    t = red.indice[sumidero]
+    if observador is not None:
+        observador.inicio(red, origen, sumidero)
+
+    # Listas de Python para el ciclo caliente: indexarlas es más rápido que indexar arreglos NumPy
+    inicio = red.inicio.tolist()
+    destino = red.destino.tolist()
+    inverso = red.inverso.tolist()
+    original = red.original.tolist()
+    residual = red.capacidad.tolist()
+    n = red.num_nodos
+
+    flujo_total = 0
+    while s != t:
+        arco_padre = [-1] * n
+        visitado = bytearray(n)
+        visitado[s] = 1
+        cola = deque([s])
+
+        # BFS restringido SOLO a aristas originales
+        while cola and not visitado[t]:
+            u = cola.popleft()
+            for a in range(inicio[u], inicio[u + 1]):
+                v = destino[a]
+                if not visitado[v] and residual[a] > 0 and original[a]:
+                    arco_padre[v] = a
+                    visitado[v] = 1
+                    cola.append(v)
+                    if v == t:
+                        break
+        if observador is not None:
+            observador.busqueda(*_recorrido(red, np.frombuffer(visitado, dtype=np.uint8) > 0, cola))
+        if not visitado[t]:
+            break
+
+        # Encontrar flujo mínimo
+        f = float('inf')
+        v = t
+        camino = []
+        while v != s:
+            a = arco_padre[v]
+            f = min(f, residual[a])
+            camino.append(a)
+            v = destino[inverso[a]]
+
+        if observador is not None:
+            observador.aumento(red, camino[::-1], f)
+
+        # Actualizar capacidades (incluye residuales para bloquear más adelante)
+        for a in camino:
+            residual[a] -= f
+            residual[inverso[a]] += f
+
+        flujo_total += f
+
+    _guardar_flujo(red, residual)
+    if observador is not None:
+        observador.fin(flujo_total)
+    return flujo_total
+
+
+def dinic(grafo, origen, sumidero, observador=None, escalado=False):
+    red = como_grafo_residual(grafo)
+    s = red.indice[origen]
+    t = red.indice[sumidero]
+    if observador is not None:
+        observador.inicio(red, origen, sumidero)
+
+    inicio = red.inicio.tolist()
+    destino = red.destino.tolist()
+    inverso = red.inverso.tolist()
+    residual = red.capacidad.tolist()
+    n = red.num_nodos
+
+    flujo_total = 0
+    # Sin escalado hay un único umbral (cualquier residual positivo);
+    # con escalado primero solo se usan arcos con residual >= delta, y delta se va achicando
+    for delta in _umbrales(red.capacidad, escalado):
+        while s != t:
+            # Grafo de niveles: distancia BFS desde el origen por arcos con residual
+            nivel = [-1] * n
+            nivel[s] = 0
+            cola = deque([s])
+            while cola:
+                u = cola.popleft()
+                for a in range(inicio[u], inicio[u + 1]):
+                    v = destino[a]
+                    if nivel[v] < 0 and residual[a] >= delta:
+                        nivel[v] = nivel[u] + 1
+                        cola.append(v)
+            if observador is not None:
+                observador.busqueda(*_recorrido(red, np.asarray(nivel) >= 0))
+            if nivel[t] < 0:
+                break
+
+            # Flujo bloqueante: DFS iterativo con puntero de arco actual por nodo
+            actual = inicio[:-1]
+            camino = []
+            u = s
+            while True:
+                if u == t:
+                    f = min(residual[a] for a in camino)
+                    for a in camino:
+                        residual[a] -= f
+                        residual[inverso[a]] += f
+                    flujo_total += f
+                    if observador is not None:
+                        observador.aumento(red, camino[:], f)
+                    # Volver al origen del primer arco que quedó bajo el umbral y seguir desde ahí
+                    k = next(i for i, a in enumerate(camino) if residual[a] < delta)
+                    u = destino[inverso[camino[k]]]
+                    del camino[k:]
+                    continue
+
+                fin = inicio[u + 1]
+                a = actual[u]
+                siguiente = nivel[u] + 1
+                while a < fin and (residual[a] < delta or nivel[destino[a]] != siguiente):
+                    a += 1
+                actual[u] = a
+                if a < fin:
+                    camino.append(a)
+                    u = destino[a]
+                    continue
+
+                # Callejón sin salida: se descarta u para esta fase y se retrocede
+                if u == s:
+                    break
+                nivel[u] = -1
+                a = camino.pop()
+                u = destino[inverso[a]]
+                actual[u] += 1
+
+    _guardar_flujo(red, residual)
+    if observador is not None:
+        observador.fin(flujo_total)
+    return flujo_total
+
+
+def edmonds_karp_escalado(grafo, origen, sumidero, observador=None):
+    # Caminos aumentantes más cortos solo por arcos con residual >= delta, con delta
+    # bajando en potencias de 2: O(E^2 log U). Usa también los arcos inversos, que el
+    # escalado necesita para garantizar el flujo máximo
+    red = como_grafo_residual(grafo)
+    s = red.indice[origen]
+    t = red.indice[sumidero]
+    if observador is not None:
+        observador.inicio(red, origen, sumidero)
+
+    inicio = red.inicio.tolist()
+    destino = red.destino.tolist()
+    inverso = red.inverso.tolist()
+    residual = red.capacidad.tolist()
+    n = red.num_nodos
+
+    flujo_total = 0
+    for delta in _umbrales(red.capacidad, escalado=True):
+        while s != t:
+            arco_padre = [-1] * n
+            visitado = bytearray(n)
+            visitado[s] = 1
+            cola = deque([s])
+            while cola and not visitado[t]:
+                u = cola.popleft()
+                for a in range(inicio[u], inicio[u + 1]):
+                    v = destino[a]
+                    if not visitado[v] and residual[a] >= delta:
+                        arco_padre[v] = a
+                        visitado[v] = 1
+                        cola.append(v)
+                        if v == t:
+                            break
+            if observador is not None:
+                observador.busqueda(*_recorrido(red, np.frombuffer(visitado, dtype=np.uint8) > 0, cola))
+            if not visitado[t]:
+                break
+
+            f = float('inf')
+            v = t
+            camino = []
+            while v != s:
+                a = arco_padre[v]
+                f = min(f, residual[a])
+                camino.append(a)
+                v = destino[inverso[a]]
+            if observador is not None:
+                observador.aumento(red, camino[::-1], f)
+            for a in camino:
+                residual[a] -= f
+                residual[inverso[a]] += f
+            flujo_total += f
+
+    _guardar_flujo(red, residual)
+    if observador is not None:
+        observador.fin(flujo_total)
+    return flujo_total
+
+
+def push_relabel(grafo, origen, sumidero, observador=None):
+    red = como_grafo_residual(grafo)
+    s = red.indice[origen]
+    t = red.indice[sumidero]
+    if observador is not None:
+        observador.inicio(red, origen, sumidero)
+
+    inicio = red.inicio.tolist()
+    destino = red.destino.tolist()
+    inverso = red.inverso.tolist()
+    residual = red.capacidad.tolist()
+    n = red.num_nodos
+    if s == t:
+        _guardar_flujo(red, residual)
+        if observador is not None:
+            observador.fin(0)
+        return 0
+
+    exceso = [0] * n
+    actual = inicio[:-1]
+
+    def empujar(a, u, d):
+        residual[a] -= d
+        residual[inverso[a]] += d
+        exceso[u] -= d
+        exceso[destino[a]] += d
+
+    def etiquetar(raiz, base):
+        # Reetiquetado global: distancia BFS hacia raiz por arcos con residual
+        altura = [-1] * n
+        altura[raiz] = base
+        cola = deque([raiz])
+        while cola:
+            v = cola.popleft()
+            for a in range(inicio[v], inicio[v + 1]):
+                u = destino[a]
+                if altura[u] < 0 and residual[inverso[a]] > 0:
+                    altura[u] = altura[v] + 1
+                    cola.append(u)
+        if observador is not None:
+            observador.busqueda(*_recorrido(red, np.asarray(altura) >= 0))
+        return altura
+
+    def reconstruir():
+        altura = etiquetar(t, 0)
+        altura = [h if h >= 0 else n for h in altura]
+        altura[s] = n
+        cuenta = [0] * (n + 1)
+        activos = [[] for _ in range(n)]
+        for u in range(n):
+            cuenta[altura[u]] += 1
+            if u != s and u != t and exceso[u] > 0 and altura[u] < n:
+                activos[altura[u]].append(u)
+        return altura, cuenta, activos
+
+    # Fase 1: preflujo máximo, activando siempre el nodo de mayor altura
+    for a in range(inicio[s], inicio[s + 1]):
+        if residual[a] > 0:
+            empujar(a, s, residual[a])
+
+    altura, cuenta, activos = reconstruir()
+    alto = n - 1
+    reetiquetas = 0
+    while True:
+        while alto >= 0 and not activos[alto]:
+            alto -= 1
+        if alto < 0:
+            break
+        u = activos[alto].pop()
+        if altura[u] != alto or exceso[u] <= 0:
+            continue
+
+        # Descargar u
+        while exceso[u] > 0 and altura[u] < n:
+            fin = inicio[u + 1]
+            a = actual[u]
+            abajo = altura[u] - 1
+            while a < fin and (residual[a] <= 0 or altura[destino[a]] != abajo):
+                a += 1
+            actual[u] = a
+            if a < fin:
+                v = destino[a]
+                if exceso[v] <= 0 and v != t and v != s:
+                    activos[abajo].append(v)
+                    alto = max(alto, abajo)
+                empujar(a, u, min(exceso[u], residual[a]))
+                continue
+
+            # Reetiquetar u; si su altura queda vacía, aplicar el heurístico del hueco
+            vieja = altura[u]
+            nueva = n
+            for b in range(inicio[u], fin):
+                if residual[b] > 0 and altura[destino[b]] + 1 < nueva:
+                    nueva = altura[destino[b]] + 1
+            cuenta[vieja] -= 1
+            if cuenta[vieja] == 0:
+                for w in range(n):
+                    if vieja < altura[w] < n:
+                        cuenta[altura[w]] -= 1
+                        altura[w] = n
+                        cuenta[n] += 1
+                nueva = n
+            altura[u] = nueva
+            cuenta[nueva] += 1
+            actual[u] = inicio[u]
+            reetiquetas += 1
+
+        if reetiquetas >= n:
+            # El reetiquetado global puede volver admisibles arcos que quedaron detrás de los
+            # punteros de arco actual: se reinician para que no haya reetiquetas falsas
+            altura, cuenta, activos = reconstruir()
+            actual = inicio[:-1]
+            alto = n - 1
+            reetiquetas = 0
+
+    flujo_total = exceso[t]
+
+    # Fase 2: devolver al origen el exceso que no pudo llegar al sumidero
+    # (los nodos sin camino residual al origen nunca reciben exceso y quedan arriba de todo)
+    altura = [h if h >= 0 else 3 * n for h in etiquetar(s, n)]
+    actual = inicio[:-1]
+    pendientes = [u for u in range(n) if u != s and u != t and exceso[u] > 0]
+    while pendientes:
+        u = pendientes.pop()
+        while exceso[u] > 0:
+            fin = inicio[u + 1]
+            a = actual[u]
+            abajo = altura[u] - 1
+            while a < fin and (residual[a] <= 0 or altura[destino[a]] != abajo):
+                a += 1
+            actual[u] = a
+            if a < fin:
+                v = destino[a]
+                if exceso[v] <= 0 and v != s:
+                    pendientes.append(v)
+                empujar(a, u, min(exceso[u], residual[a]))
+            else:
+                altura[u] = 1 + min(altura[destino[b]] for b in range(inicio[u], fin) if residual[b] > 0)
+                actual[u] = inicio[u]
+
+    _guardar_flujo(red, residual)
+    if observador is not None:
+        observador.fin(flujo_total)
+    return flujo_total
+
+
+METODOS = {
+    'edmonds_karp_no_inversos': edmonds_karp_no_inversos,
+    'dinic': dinic,
+    'push_relabel': push_relabel,
+    'edmonds_karp_escalado': edmonds_karp_escalado,
+    'boykov_kolmogorov': boykov_kolmogorov,
+}
+
+
+def flujo_maximo(grafo, origen, sumidero, metodo='edmonds_karp_no_inversos', corte=False,
+                 observador=None, escalado=False):
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido: {metodo!r}. Opciones: {', '.join(METODOS)}")
+    red = como_grafo_residual(grafo)
+    if not escalado:
+        valor = METODOS[metodo](red, origen, sumidero, observador=observador)
+    elif metodo == 'dinic':
+        valor = dinic(red, origen, sumidero, observador=observador, escalado=True)
+    elif metodo in ('edmonds_karp_no_inversos', 'edmonds_karp_escalado'):
+        valor = edmonds_karp_escalado(red, origen, sumidero, observador=observador)
+    else:
+        raise ValueError("El escalado de capacidades solo aplica a los métodos de caminos aumentantes")
+    if not corte:
+        return valor
+    voraz = metodo == 'edmonds_karp_no_inversos' and not escalado
+    s, t = red.indice[origen], red.indice[sumidero]
+    if voraz and s != t and lado_del_origen(red, s)[t]:
+        # El voraz no usa arcos inversos y su flujo puede no ser máximo: sin un flujo máximo
+        # no hay corte certificado, y recalcular con otro método cambiaría el valor devuelto
+        raise ValueError("El método 'edmonds_karp_no_inversos' no llegó al flujo máximo en esta red, "
+                         "así que no da un corte mínimo certificado: usar un método exacto como 'dinic'")
+    return valor, corte_minimo(red, origen, sumidero)
+
+
+def corte_minimo(red, origen, sumidero):
+    # Con el flujo final ya guardado en la red, el lado del origen del corte mínimo
+    # son los nodos alcanzables desde el origen por arcos con residual (un BFS lineal)
+    if red.indice[origen] == red.indice[sumidero]:
+        # Origen igual al sumidero: no hay nada que separar, el corte vacío tiene capacidad 0
+        return [origen], []
+    alcanzado = lado_del_origen(red, red.indice[origen])
+    if alcanzado[red.indice[sumidero]]:
+        raise ValueError("El flujo de la red no es máximo: el sumidero sigue alcanzable")
+
+    # Calles originales que cruzan del lado del origen al del sumidero (todas saturadas)
+    inicio = red.inicio.tolist()
+    destino = red.destino.tolist()
+    original = red.original.tolist()
+    capacidad = red.capacidad.tolist()
+    lado_origen = [red.nodos[u] for u in range(red.num_nodos) if alcanzado[u]]
+    arcos_corte = []
+    for u in range(red.num_nodos):
+        if alcanzado[u]:
+            for a in range(inicio[u], inicio[u + 1]):
+                if original[a] and not alcanzado[destino[a]]:
+                    arcos_corte.append((red.nodos[u], red.nodos[destino[a]], capacidad[a]))
+    return lado_origen, arcos_corte
+
+
+def lado_del_origen(red, s):
+    # Marca (bytearray) de los nodos alcanzables desde el índice s en la red residual
+    inicio = red.inicio.tolist()
+    destino = red.destino.tolist()
+    residual = red.residual().tolist()
+
+    alcanzado = bytearray(red.num_nodos)
+    alcanzado[s] = 1
+    cola = deque([s])
+    while cola:
+        u = cola.popleft()
+        for a in range(inicio[u], inicio[u + 1]):
+            v = destino[a]
+            if not alcanzado[v] and residual[a] > 0:
+                alcanzado[v] = 1
+                cola.append(v)
+    return alcanzado
+
+
+def _recorrido(red, alcanzados, pendientes=()):
+    # Solo con observador: nodos que salieron de la cola de un BFS y arcos que se revisaron
+    # (los grados de esos nodos); se calcula después del BFS para no tocar el ciclo caliente
+    grado = np.diff(red.inicio)
+    pendientes = np.fromiter(pendientes, dtype=np.int64)
+    visitados = int(alcanzados.sum()) - len(pendientes)
+    return visitados, int(grado[alcanzados].sum() - grado[pendientes].sum())
+
+
+def _guardar_flujo(red, residual):
+    red.flujo[:] = red.capacidad - np.asarray(residual, dtype=red.capacidad.dtype)
+
+
+def _umbrales(capacidad, escalado):
+    # Residual mínimo para usar un arco en cada fase. "Residual > 0" se escribe como
+    # ">= minimo" (1 con capacidades enteras) para que todas las fases usen la misma comparación
+    minimo = 1 if capacidad.dtype.kind in 'iub' else np.finfo(capacidad.dtype).tiny
+    umbrales = []
+    maximo = capacidad.max(initial=0)
+    if escalado and maximo >= 1:
+        delta = 1 << (int(maximo).bit_length() - 1)
+        while delta >= 1:
+            umbrales.append(delta)
+            delta //= 2
+    if not umbrales or umbrales[-1] != minimo:
+        umbrales.append(minimo)
+    return umbrales
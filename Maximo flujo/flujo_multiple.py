@@ -0,0 +1,75 @@
+import numpy as np
+
+from flujo_maximo import METODOS
+from grafo_residual import como_grafo_residual, desde_arcos
+
+
+def flujo_maximo_multiple(grafo, origenes, sumideros, capacidad_nodos=None, metodo='dinic',
+                          observador=None):
+    """Flujo máximo con varios orígenes y sumideros y con límite de paso por nodo.
+
+    `capacidad_nodos` es un dict {nodo: capacidad} con lo máximo que puede
+    atravesar cada cruce (incluido lo que emite un origen o absorbe un
+    sumidero); los nodos que no aparecen no tienen límite. La transformación
+    se hace sobre los arreglos CSR: cada nodo con capacidad se parte en
+    entrada -> salida, y se agregan un superorigen hacia todos los orígenes y
+    un supersumidero desde todos los sumideros.
+
+    El flujo resultante queda en `red.flujo` de la red original (si `grafo` ya
+    era un GrafoResidual). Devuelve (valor, flujos, paso): flujos[(u, v)] es el
+    flujo de cada calle usada y paso[nodo] lo que atraviesa cada nodo.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido: {metodo!r}. Opciones: {', '.join(METODOS)}")
+    red = como_grafo_residual(grafo)
+    n = red.num_nodos
+    fuentes = np.array([red.indice[x] for x in origenes], dtype=np.int64)
+    destinos = np.array([red.indice[x] for x in sumideros], dtype=np.int64)
+    if np.intersect1d(fuentes, destinos).size:
+        raise ValueError("Un nodo no puede ser origen y sumidero a la vez")
+    capacidad_nodos = capacidad_nodos or {}
+    partidos = np.array([red.indice[x] for x in capacidad_nodos], dtype=np.int64)
+    limites = np.array(list(capacidad_nodos.values()) or np.zeros(0, dtype=red.capacidad.dtype))
+    if (limites < 0).any():
+        raise ValueError("La capacidad de un nodo no puede ser negativa")
+
+    # Índices nuevos: 0..n-1 son los nodos (o su entrada), n..n+k-1 las salidas de los
+    # nodos partidos, y al final el superorigen y el supersumidero
+    k = len(partidos)
+    salida = np.arange(n)
+    salida[partidos] = n + np.arange(k)
+    superorigen, supersumidero = n + k, n + k + 1
+
+    desde_calle = red.arcos_desde()
+    calles = np.flatnonzero(red.original & (desde_calle != red.destino))
+    infinito = red.capacidad[calles].sum() + 1  # ningún flujo puede superar la suma de capacidades
+    desde = np.concatenate([salida[desde_calle[calles]], partidos,
+                            np.full(len(fuentes), superorigen), salida[destinos]])
+    hasta = np.concatenate([red.destino[calles], n + np.arange(k),
+                            fuentes, np.full(len(destinos), supersumidero)])
+    capacidad = np.concatenate([red.capacidad[calles], limites,
+                                np.full(len(fuentes) + len(destinos), infinito, dtype=red.capacidad.dtype)])
+    ampliada = desde_arcos(desde, hasta, capacidad, nodos=range(n + k + 2))
+    valor = METODOS[metodo](ampliada, superorigen, supersumidero, observador=observador)
+
+    # desde_arcos ordena los arcos de ida de forma estable por nodo de salida, así que
+    # el i-ésimo arco de entrada es el i-ésimo arco original en el orden de ese ordenamiento
+    por_arco = np.empty(len(desde), dtype=ampliada.flujo.dtype)
+    por_arco[np.argsort(desde, kind='stable')] = ampliada.flujo[ampliada.original]
+
+    m = len(calles)
+    red.flujo[:] = 0
+    np.add.at(red.flujo, calles, por_arco[:m])
+    np.add.at(red.flujo, red.inverso[calles], -por_arco[:m])
+
+    # Lo que atraviesa un nodo es lo que le entra por calles más lo que recibe del superorigen
+    entra = np.concatenate([red.destino[calles], fuentes])
+    cantidad = np.concatenate([por_arco[:m], por_arco[m + k:m + k + len(fuentes)]])
+    paso = np.zeros(n, dtype=ampliada.flujo.dtype)
+    np.add.at(paso, entra, cantidad)
+    flujos = {}
+    for u, v, f in zip(desde_calle[calles].tolist(), red.destino[calles].tolist(), por_arco[:m].tolist()):
+        if f > 0:
+            clave = (red.nodos[u], red.nodos[v])
+            flujos[clave] = flujos.get(clave, 0) + f
+    return valor, flujos, {red.nodos[v]: paso[v].item() for v in np.flatnonzero(paso)}
@@ -0,0 +1,104 @@
+import numpy as np
+
+from grafo_residual import desde_arcos, grilla
+
+
+def aleatorio_disperso(num_arcos, semilla, grado=4, capacidad_maxima=100):
+    # Cada nodo tiene `grado` arcos de salida hacia nodos al azar; origen 0, sumidero n-1
+    rng = np.random.default_rng(semilla)
+    n = max(2, num_arcos // grado)
+    desde = np.repeat(np.arange(n), grado)
+    hasta = rng.integers(0, n, size=len(desde))
+    capacidad = rng.integers(1, capacidad_maxima + 1, size=len(desde))
+    return desde_arcos(desde, hasta, capacidad, nodos=range(n)), 0, n - 1
+
+
+def aleatorio_denso(num_arcos, semilla, densidad=0.5, capacidad_maxima=100):
+    # Cada arco (u, v) con u != v aparece con probabilidad `densidad`; n se elige para que
+    # haya unos num_arcos arcos. Origen 0, sumidero n-1
+    rng = np.random.default_rng(semilla)
+    n = max(2, round((1 + (1 + 4 * num_arcos / densidad) ** 0.5) / 2))
+    elegidos = rng.random((n, n)) < densidad
+    np.fill_diagonal(elegidos, False)
+    desde, hasta = np.nonzero(elegidos)
+    capacidad = rng.integers(1, capacidad_maxima + 1, size=len(desde))
+    return desde_arcos(desde, hasta, capacidad, nodos=range(n)), 0, n - 1
+
+
+def rmf(num_arcos, semilla, capacidad_minima=1, capacidad_maxima=100):
+    """Red GENRMF (Goldfarb-Grigoriadis): b marcos de a x a nodos en fila.
+
+    Dentro de cada marco los vecinos de la grilla se unen en ambos sentidos con
+    capacidad grande (capacidad_maxima * a * a); entre un marco y el siguiente cada
+    nodo manda un arco a un nodo de una permutación al azar, con capacidad en
+    [capacidad_minima, capacidad_maxima]. Los caminos aumentantes son largos y se
+    cruzan mucho, por eso es una familia difícil para los métodos de caminos.
+    Origen: primer nodo del primer marco; sumidero: último nodo del último marco.
+    """
+    rng = np.random.default_rng(semilla)
+    a = max(2, round((num_arcos / 5) ** (1 / 3)))
+    b = max(2, round(num_arcos / (5 * a * a)))
+    por_marco = a * a
+    numero = np.arange(por_marco).reshape(a, a)
+    vecinos = np.concatenate([
+        np.stack([numero[:, :-1].ravel(), numero[:, 1:].ravel()]),
+        np.stack([numero[:-1, :].ravel(), numero[1:, :].ravel()]),
+    ], axis=1)
+    internos = np.concatenate([vecinos, vecinos[::-1]], axis=1)
+
+    desde, hasta, capacidad = [], [], []
+    for marco in range(b):
+        base = marco * por_marco
+        desde.append(internos[0] + base)
+        hasta.append(internos[1] + base)
+        capacidad.append(np.full(internos.shape[1], capacidad_maxima * por_marco))
+        if marco + 1 < b:
+            desde.append(np.arange(por_marco) + base)
+            hasta.append(rng.permutation(por_marco) + base + por_marco)
+            capacidad.append(rng.integers(capacidad_minima, capacidad_maxima + 1, size=por_marco))
+    n = b * por_marco
+    red = desde_arcos(np.concatenate(desde), np.concatenate(hasta), np.concatenate(capacidad),
+                      nodos=range(n))
+    return red, 0, n - 1
+
+
+def grilla_2d(num_arcos, semilla, capacidad_maxima=100, terminales=0.2):
+    # Grilla cuadrada como las de segmentación: cada celda se une al origen o al
+    # sumidero con probabilidad `terminales`; unos 6 arcos por celda
+    rng = np.random.default_rng(semilla)
+    lado = max(2, round((num_arcos / 6) ** 0.5))
+    forma = (lado, lado)
+    vecinos = [rng.integers(1, capacidad_maxima + 1, size=(lado - 1, lado)),
+               rng.integers(1, capacidad_maxima + 1, size=(lado, lado - 1))]
+    desde_origen = rng.integers(1, capacidad_maxima + 1, size=forma) * (rng.random(forma) < terminales)
+    hacia_sumidero = rng.integers(1, capacidad_maxima + 1, size=forma) * (rng.random(forma) < terminales)
+    return grilla(vecinos, desde_origen, hacia_sumidero)
+
+
+def bipartito(num_arcos, semilla, grado=4, capacidad_maxima=100):
+    # Asignación: origen -> k nodos izquierdos -> `grado` derechos al azar -> sumidero;
+    # los arcos del medio no limitan, así que el flujo lo deciden los de los extremos
+    rng = np.random.default_rng(semilla)
+    k = max(1, num_arcos // (grado + 2))
+    origen, sumidero = 2 * k, 2 * k + 1
+    izquierda = np.arange(k)
+    derecha = np.arange(k, 2 * k)
+    medio_desde = np.repeat(izquierda, grado)
+    medio_hasta = rng.integers(k, 2 * k, size=len(medio_desde))
+    desde = np.concatenate([np.full(k, origen), medio_desde, derecha])
+    hasta = np.concatenate([izquierda, medio_hasta, np.full(k, sumidero)])
+    capacidad = np.concatenate([
+        rng.integers(1, capacidad_maxima + 1, size=k),
+        np.full(len(medio_desde), capacidad_maxima),
+        rng.integers(1, capacidad_maxima + 1, size=k),
+    ])
+    return desde_arcos(desde, hasta, capacidad, nodos=range(2 * k + 2)), origen, sumidero
+
+
+FAMILIAS = {
+    'aleatorio_disperso': aleatorio_disperso,
+    'aleatorio_denso': aleatorio_denso,
+    'rmf': rmf,
+    'grilla': grilla_2d,
+    'bipartito': bipartito,
+}
@@ -0,0 +1,108 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from flujo_maximo import dinic, lado_del_origen
+from grafo_residual import como_grafo_residual, no_dirigido
+
+
+class ArbolGomoryHu:
+    """Árbol de cortes mínimos: el corte entre u y v es la arista más liviana del camino u-v.
+
+    padre[i] y valor[i] describen la arista (i, padre[i]); la raíz es el nodo 0.
+    """
+
+    def __init__(self, nodos, padre, valor):
+        self.nodos = nodos
+        self.indice = {nodo: i for i, nodo in enumerate(nodos)}
+        self.padre = padre
+        self.valor = valor
+
+    def aristas(self):
+        return [(self.nodos[i], self.nodos[self.padre[i]], self.valor[i])
+                for i in range(1, len(self.nodos))]
+
+    def corte_minimo(self, u, v):
+        # Mínimo en el camino del árbol: se suben ambos extremos hasta el ancestro común, O(n)
+        iu = self.indice[u]
+        iv = self.indice[v]
+        if iu == iv:
+            return float('inf')
+        minimo_hasta = {iu: float('inf')}
+        minimo = float('inf')
+        while iu != 0:
+            minimo = min(minimo, self.valor[iu])
+            iu = self.padre[iu]
+            minimo_hasta[iu] = minimo
+        minimo = float('inf')
+        while iv not in minimo_hasta:
+            minimo = min(minimo, self.valor[iv])
+            iv = self.padre[iv]
+        return min(minimo, minimo_hasta[iv])
+
+
+def arbol_gomory_hu(grafo, procesos=1):
+    """Árbol de Gomory-Hu con la variante de Gusfield (n - 1 flujos máximos).
+
+    Los cortes de Gomory-Hu solo existen para redes no dirigidas, así que cada
+    par de nodos se toma con capacidad c(u, v) + c(v, u). Con ``procesos > 1``
+    los flujos se calculan en paralelo de forma especulativa: el corte del
+    nodo s se lanza con el padre que tiene en ese momento y, si al llegar su
+    turno ese padre cambió, se vuelve a calcular.
+    """
+    red = no_dirigido(como_grafo_residual(grafo))
+    n = red.num_nodos
+    padre = [0] * n
+    valor = [0] * n
+
+    if procesos <= 1:
+        for s in range(1, n):
+            corte, lado = _cortar(red, s, padre[s])
+            _actualizar(padre, valor, s, corte, lado)
+        return ArbolGomoryHu(red.nodos, padre, valor)
+
+    ventana = 2 * procesos
+    with ProcessPoolExecutor(procesos, initializer=_iniciar_trabajador, initargs=(red,)) as pool:
+        lanzados = {}
+        for s in range(1, min(n, 1 + ventana)):
+            lanzados[s] = (padre[s], pool.submit(_cortar_en_trabajador, s, padre[s]))
+        for s in range(1, n):
+            t, futuro = lanzados.pop(s)
+            if t != padre[s]:
+                futuro.cancel()
+                futuro = pool.submit(_cortar_en_trabajador, s, padre[s])
+            corte, lado = futuro.result()
+            _actualizar(padre, valor, s, corte, lado)
+            siguiente = s + ventana
+            if siguiente < n:
+                lanzados[siguiente] = (padre[siguiente], pool.submit(_cortar_en_trabajador, siguiente, padre[siguiente]))
+    return ArbolGomoryHu(red.nodos, padre, valor)
+
+
+def _actualizar(padre, valor, s, corte, lado):
+    t = padre[s]
+    valor[s] = corte
+    for i in range(len(padre)):
+        if i != s and lado[i] and padre[i] == t:
+            padre[i] = s
+    if lado[padre[t]]:
+        padre[s] = padre[t]
+        padre[t] = s
+        valor[s] = valor[t]
+        valor[t] = corte
+
+
+def _cortar(red, s, t):
+    corte = dinic(red, red.nodos[s], red.nodos[t])
+    return corte, lado_del_origen(red, s)
+
+
+_red_trabajador = None
+
+
+def _iniciar_trabajador(red):
+    # Cada proceso recibe la red una sola vez, no en cada tarea
+    global _red_trabajador
+    _red_trabajador = red
+
+
+def _cortar_en_trabajador(s, t):
+    return _cortar(_red_trabajador, s, t)
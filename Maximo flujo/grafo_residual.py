@@ -0,0 +1,249 @@
+import operator
+
+import numpy as np
+
+
+class _IndiceRango:
+    # Índice de los nodos 0..n-1 sin dict: la identidad, pero un nombre fuera de rango
+    # (incluido -1) lanza KeyError igual que el índice dict de los demás grafos
+    def __init__(self, n):
+        self.n = n
+
+    def __getitem__(self, nodo):
+        try:
+            i = operator.index(nodo)
+        except TypeError:
+            raise KeyError(nodo) from None
+        if not 0 <= i < self.n:
+            raise KeyError(nodo)
+        return i
+
+    def __contains__(self, nodo):
+        try:
+            self[nodo]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self):
+        return self.n
+
+
+class GrafoResidual:
+    """Red residual compacta en formato CSR (filas comprimidas).
+
+    Los nodos se internan como enteros 0..n-1 y los arcos que salen del nodo u
+    ocupan las posiciones inicio[u]:inicio[u + 1]. Cada par de nodos conectados
+    tiene un arco por sentido; inverso[a] es el arco opuesto de a. El flujo es
+    antisimétrico (flujo[a] == -flujo[inverso[a]]) y el residual de un arco es
+    capacidad[a] - flujo[a].
+    """
+
+    def __init__(self, nodos, inicio, destino, capacidad, inverso, original, costo=None):
+        if isinstance(nodos, range) and nodos.start == 0 and nodos.step == 1:
+            # Nodos 0..n-1: el índice es la identidad y no hace falta un dict de n entradas
+            self.nodos = nodos
+            self.indice = _IndiceRango(len(nodos))
+        else:
+            self.nodos = list(nodos)
+            self.indice = {nodo: i for i, nodo in enumerate(self.nodos)}
+        self.inicio = inicio
+        self.destino = destino
+        self.capacidad = capacidad
+        self.inverso = inverso
+        self.original = original  # True solo para las calles del grafo de entrada
+        self.costo = costo  # costo por unidad; el arco inverso lleva el costo negado
+        self.flujo = np.zeros_like(capacidad)
+
+    @property
+    def num_nodos(self):
+        return len(self.nodos)
+
+    @property
+    def num_arcos(self):
+        return len(self.destino)
+
+    def arcos_desde(self):
+        # Nodo de salida de cada arco (la "fila" del CSR expandida)
+        return np.repeat(np.arange(self.num_nodos), np.diff(self.inicio))
+
+    def residual(self):
+        return self.capacidad - self.flujo
+
+    def reiniciar(self):
+        self.flujo[:] = 0
+
+    def flujos_por_arco(self):
+        # Flujo neto positivo sobre las calles originales, con los nombres de los nodos
+        desde = self.arcos_desde()
+        usados = np.flatnonzero(self.original & (self.flujo > 0))
+        return {(self.nodos[desde[a]], self.nodos[self.destino[a]]): self.flujo[a].item()
+                for a in usados}
+
+
+def no_dirigido(red):
+    # Misma estructura, pero cada par de nodos puede pasar c(u, v) + c(v, u) en ambos sentidos
+    capacidad = red.capacidad + red.capacidad[red.inverso]
+    return GrafoResidual(red.nodos, red.inicio, red.destino, capacidad, red.inverso,
+                         red.original | red.original[red.inverso])
+
+
+def desde_arcos(desde, hasta, capacidad, costo=None, nodos=None):
+    """Construye la red CSR directamente desde arreglos de arcos (u, v, capacidad).
+
+    Los nodos son enteros 0..n-1 (o posiciones en `nodos`). A diferencia de
+    desde_dict, cada arco de entrada tiene su propio par de arcos aunque exista
+    la calle opuesta, lo que hace falta cuando cada sentido tiene su propio costo.
+    """
+    desde = np.asarray(desde, dtype=np.int64)
+    hasta = np.asarray(hasta, dtype=np.int64)
+    capacidad = _como_capacidades(capacidad)
+    validos = desde != hasta  # un lazo no aporta flujo
+    desde, hasta, capacidad = desde[validos], hasta[validos], capacidad[validos]
+    if nodos is None:
+        n = int(max(desde.max(initial=-1), hasta.max(initial=-1))) + 1
+        nodos = range(n)
+    m = len(desde)
+
+    if costo is not None:
+        costo = np.asarray(costo)[validos]
+    return _desde_pares(nodos, desde, hasta, capacidad, np.zeros_like(capacidad),
+                        np.ones(m, dtype=bool), np.zeros(m, dtype=bool), costo)
+
+
+def grilla(vecinos, desde_origen, hacia_sumidero):
+    """Red de una grilla 2D/3D armada directamente desde arreglos NumPy.
+
+    `desde_origen` y `hacia_sumidero` tienen la forma de la grilla y dan la
+    capacidad de cada celda con los terminales. `vecinos[k]` da la capacidad
+    (igual en ambos sentidos) entre cada celda y la siguiente sobre el eje k, así
+    que su forma es la de la grilla con un elemento menos en ese eje. Las celdas
+    son los nodos 0..N-1 en orden C; devuelve (red, origen, sumidero) con
+    origen = N y sumidero = N + 1. Las capacidades cero no generan arcos.
+    """
+    forma = np.shape(desde_origen)
+    celdas = int(np.prod(forma))
+    numero = np.arange(celdas, dtype=np.int64).reshape(forma)
+    origen, sumidero = celdas, celdas + 1
+
+    partes = []
+    for eje, capacidad in enumerate(vecinos):
+        antes = [slice(None)] * len(forma)
+        despues = [slice(None)] * len(forma)
+        antes[eje] = slice(None, -1)
+        despues[eje] = slice(1, None)
+        capacidad = np.asarray(capacidad).ravel()
+        partes.append((numero[tuple(antes)].ravel(), numero[tuple(despues)].ravel(), capacidad, capacidad, True))
+    entrada = np.asarray(desde_origen).ravel()
+    salida = np.asarray(hacia_sumidero).ravel()
+    celda = numero.ravel()
+    partes.append((np.full(celdas, origen), celda, entrada, np.zeros_like(entrada), False))
+    partes.append((celda, np.full(celdas, sumidero), salida, np.zeros_like(salida), False))
+
+    desde, hasta, ida, vuelta, original_vuelta = [], [], [], [], []
+    for u, v, c_ida, c_vuelta, doble in partes:
+        usados = (c_ida > 0) | (c_vuelta > 0)
+        desde.append(u[usados])
+        hasta.append(v[usados])
+        ida.append(c_ida[usados])
+        vuelta.append(c_vuelta[usados])
+        original_vuelta.append(np.full(int(usados.sum()), doble))
+    ida = _como_capacidades(np.concatenate(ida))
+    red = _desde_pares(range(celdas + 2), np.concatenate(desde), np.concatenate(hasta), ida,
+                       np.concatenate(vuelta).astype(ida.dtype), np.ones(len(ida), dtype=bool),
+                       np.concatenate(original_vuelta))
+    return red, origen, sumidero
+
+
+def _desde_pares(nodos, desde, hasta, ida, vuelta, original_ida, original_vuelta, costo=None):
+    # Un par de arcos por elemento: desde->hasta con capacidad `ida` y su inverso con `vuelta`.
+    # Los arcos 0..m-1 son los de ida y m..2m-1 sus inversos; luego se ordenan por nodo de salida
+    n = len(nodos)
+    m = len(desde)
+    cola = np.concatenate([desde, hasta])
+    orden = np.argsort(cola, kind='stable')
+    posicion = np.empty(2 * m, dtype=np.int64)
+    posicion[orden] = np.arange(2 * m)
+    pareja = np.concatenate([np.arange(m, 2 * m), np.arange(m)])
+    if costo is not None:
+        costo = np.concatenate([costo, -costo])[orden]
+
+    return GrafoResidual(
+        nodos=nodos,
+        inicio=np.concatenate([[0], np.cumsum(np.bincount(cola, minlength=n))]).astype(np.int64),
+        destino=np.concatenate([hasta, desde])[orden],
+        capacidad=np.concatenate([ida, vuelta])[orden],
+        inverso=posicion[pareja[orden]],
+        original=np.concatenate([original_ida, original_vuelta])[orden],
+        costo=costo,
+    )
+
+
+def desde_dict(grafo):
+    """Convierte una sola vez el formato ``grafo[u][v] = capacidad`` a CSR.
+
+    Las calles en sentidos opuestos entre el mismo par de nodos comparten un
+    único par de arcos, igual que el diccionario ``capacidad`` que armaba
+    ``edmonds_karp_no_inversos``, y se conserva el orden de vecinos de ese
+    diccionario para que los caminos encontrados sean los mismos.
+    """
+    indice = {}
+    vecinos = []  # por nodo: {vecino: capacidad}, en orden de inserción
+    originales = set()
+
+    def internar(nodo):
+        if nodo not in indice:
+            indice[nodo] = len(indice)
+            vecinos.append({})
+        return indice[nodo]
+
+    for u in grafo:
+        iu = internar(u)
+        for v, c in grafo[u].items():
+            iv = internar(v)
+            if iu == iv:
+                continue  # un lazo no aporta flujo
+            vecinos[iu][iv] = c
+            originales.add((iu, iv))
+            if iu not in vecinos[iv]:
+                vecinos[iv][iu] = 0
+
+    inicio = [0]
+    destino = []
+    capacidad = []
+    original = []
+    posicion = {}
+    for iu, adyacentes in enumerate(vecinos):
+        for iv, c in adyacentes.items():
+            posicion[iu, iv] = len(destino)
+            destino.append(iv)
+            capacidad.append(c)
+            original.append((iu, iv) in originales)
+        inicio.append(len(destino))
+
+    desde = np.repeat(np.arange(len(vecinos)), np.diff(inicio))
+    inverso = [posicion[iv, iu] for iu, iv in zip(desde.tolist(), destino)]
+
+    return GrafoResidual(
+        nodos=list(indice),
+        inicio=np.asarray(inicio, dtype=np.int64),
+        destino=np.asarray(destino, dtype=np.int64),
+        capacidad=_como_capacidades(capacidad),
+        inverso=np.asarray(inverso, dtype=np.int64),
+        original=np.asarray(original, dtype=bool),
+    )
+
+
+def como_grafo_residual(grafo):
+    # Permite que los algoritmos acepten tanto el dict de los scripts como un GrafoResidual
+    if isinstance(grafo, GrafoResidual):
+        return grafo
+    return desde_dict(grafo)
+
+
+def _como_capacidades(valores):
+    # Enteros si todas las capacidades son enteras, flotantes en otro caso
+    arreglo = np.asarray(valores)
+    if arreglo.dtype.kind in 'iub':
+        return arreglo.astype(np.int64)
+    return arreglo.astype(np.float64)
@@ -0,0 +1,90 @@
+import time
+
+
+class Observador:
+    """Base de los observadores que aceptan los algoritmos de flujo máximo.
+
+    Los algoritmos solo llaman a estos métodos cuando reciben un observador,
+    así que sin observador no pagan nada por la instrumentación.
+    """
+
+    def inicio(self, red, origen, sumidero):
+        pass
+
+    def busqueda(self, visitados, arcos):
+        # Después de cada búsqueda: nodos que se sacaron de la cola y arcos que se revisaron
+        pass
+
+    def aumento(self, red, camino, f):
+        # camino: índices de arcos del origen al sumidero; f: flujo enviado (cuello de botella)
+        pass
+
+    def fin(self, flujo_total):
+        pass
+
+
+class Contadores(Observador):
+    def __init__(self):
+        self.busquedas = 0
+        self.nodos_visitados = 0
+        self.arcos_revisados = 0
+        self.aumentos = 0
+        self.cuellos = []
+        self.segundos = 0.0
+        self._reloj = None
+
+    def inicio(self, red, origen, sumidero):
+        self._reloj = time.perf_counter()
+
+    def busqueda(self, visitados, arcos):
+        self.busquedas += 1
+        self.nodos_visitados += visitados
+        self.arcos_revisados += arcos
+
+    def aumento(self, red, camino, f):
+        self.aumentos += 1
+        self.cuellos.append(f)
+
+    def fin(self, flujo_total):
+        self.segundos += time.perf_counter() - self._reloj
+
+    def resumen(self):
+        return {
+            'busquedas': self.busquedas,
+            'nodos_visitados': self.nodos_visitados,
+            'arcos_revisados': self.arcos_revisados,
+            'aumentos': self.aumentos,
+            'cuello_minimo': min(self.cuellos, default=0),
+            'cuello_maximo': max(self.cuellos, default=0),
+            'segundos': self.segundos,
+        }
+
+
+class CaminosVerbosos(Observador):
+    # El registro de siempre: imprime cada camino aumentante con su flujo
+    def aumento(self, red, camino, f):
+        desde = red.destino[red.inverso[camino]].tolist()
+        hasta = red.destino[camino].tolist()
+        nombres = [(red.nodos[u], red.nodos[v]) for u, v in zip(desde, hasta)]
+        print(f"Camino usado: {nombres}, flujo: {f}")
+
+
+class Varios(Observador):
+    def __init__(self, *observadores):
+        self.observadores = observadores
+
+    def inicio(self, red, origen, sumidero):
+        for o in self.observadores:
+            o.inicio(red, origen, sumidero)
+
+    def busqueda(self, visitados, arcos):
+        for o in self.observadores:
+            o.busqueda(visitados, arcos)
+
+    def aumento(self, red, camino, f):
+        for o in self.observadores:
+            o.aumento(red, camino, f)
+
+    def fin(self, flujo_total):
+        for o in self.observadores:
+            o.fin(flujo_total)
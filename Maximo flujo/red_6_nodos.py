@@ -1,61 +1,9 @@
-from collections import deque, defaultdict
+from flujo_maximo import flujo_maximo
+from observadores import CaminosVerbosos
 
-def edmonds_karp_no_inversos(grafo, origen, sumidero):
-    flujo_total = 0
-    capacidad = defaultdict(dict)
-    originales = set()
-
-    # Crear copia de capacidades y registrar solo las aristas originales (permitidas)
-    for u in grafo:
-        for v in grafo[u]:
-            capacidad[u][v] = grafo[u][v]
-            originales.add((u, v))
-            if v not in capacidad or u not in capacidad[v]:
-                capacidad[v][u] = 0  # residuales, pero no permitidas en BFS
-
-    while True:
-        padre = {}
-        visitado = set()
-        cola = deque([origen])
-        visitado.add(origen)
-
-        # BFS restringido SOLO a aristas originales
-        while cola:
-            u = cola.popleft()
-            for v in capacidad[u]:
-                if v not in visitado and capacidad[u][v] > 0 and (u, v) in originales:
-                    padre[v] = u
-                    visitado.add(v)
-                    cola.append(v)
-                    if v == sumidero:
-                        break
-        if sumidero not in padre:
-            break
-
-        # Encontrar flujo mínimo
-        f = float('inf')
-        v = sumidero
-        camino = []
-        while v != origen:
-            u = padre[v]
-            f = min(f, capacidad[u][v])
-            camino.append((u, v))
-            v = u
-
-        # Mostrar camino válido
-        print(f"Camino usado: {list(reversed(camino))}, flujo: {f}")
-
-        # Actualizar capacidades (incluye residuales para bloquear más adelante)
-        v = sumidero
-        while v != origen:
-            u = padre[v]
-            capacidad[u][v] -= f
-            capacidad[v][u] += f  # esta se usará para bloquear loops, no para buscar más camino
-            v = u
-
-        flujo_total += f
-
-    return flujo_total
+# Algoritmo a usar: 'edmonds_karp_no_inversos', 'dinic', 'push_relabel',
+# 'edmonds_karp_escalado' o 'boykov_kolmogorov'
+metodo = 'edmonds_karp_no_inversos'
 
 # Definir el grafo original (calles unidireccionales)
 grafo = {
@@ -69,4 +17,12 @@ grafo = {
 }
 
 # Ejecutar algoritmo corregido
-print("\nFlujo máximo:", edmonds_karp_no_inversos(grafo, '0', '6'))
\ No newline at end of file
+flujo, (lado_origen, calles_criticas) = flujo_maximo(grafo, '0', '6', metodo=metodo, corte=True,
+                                                    observador=CaminosVerbosos())
+print("\nFlujo máximo:", flujo)
+
+# Corte mínimo: las calles saturadas que separan el origen del sumidero
+print("Nodos del lado del origen:", lado_origen)
+print("Calles críticas del corte mínimo:")
+for u, v, c in calles_criticas:
+    print(f"{u} -> {v} (capacidad {c})")
\ No newline at end of file